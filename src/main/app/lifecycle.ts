@@ -8,10 +8,7 @@
  */
 
 import { app, BrowserWindow } from 'electron';
-import electronUpdater from 'electron-updater';
 import type { UpdateInfo } from 'electron-updater';
-
-const { autoUpdater } = electronUpdater;
 import { logger } from '../config/logger.js';
 import { getModeManager } from './mode-manager.js';
 import type { ModeSwitchEvent } from './mode-manager.js';
@@ -33,14 +30,48 @@ export interface UpdateCheckResult {
  * Set GITHUB_REPO_OWNER in environment or .env for update checks to work.
  */
 const GITHUB_REPO_OWNER = process.env.GITHUB_REPO_OWNER ?? 'your-username';
-autoUpdater.setFeedURL({
-  provider: 'github',
-  owner: GITHUB_REPO_OWNER,
-  repo: 'mailCopilot',
-});
 
-autoUpdater.autoDownload = false; // Ask user before downloading
-autoUpdater.autoInstallOnAppQuit = false; // Ask user before installing
+type AutoUpdater = (typeof import('electron-updater'))['autoUpdater'];
+
+/**
+ * Pending electron-updater import, shared by every caller
+ *
+ * electron-updater pulls in a large dependency tree (HTTP, YAML, semver,
+ * file helpers) that is only needed once an update check actually runs,
+ * so it is kept off the startup path and configured on first use.
+ */
+let autoUpdaterModule: Promise<AutoUpdater> | undefined;
+
+/**
+ * Load and configure the auto-updater on first use
+ *
+ * A failed import is not cached so a later check can retry it.
+ *
+ * @returns Configured autoUpdater instance
+ */
+function loadAutoUpdater(): Promise<AutoUpdater> {
+  autoUpdaterModule ??= import('electron-updater').then(
+    ({ default: electronUpdater }) => {
+      const { autoUpdater } = electronUpdater;
+
+      autoUpdater.setFeedURL({
+        provider: 'github',
+        owner: GITHUB_REPO_OWNER,
+        repo: 'mailCopilot',
+      });
+
+      autoUpdater.autoDownload = false; // Ask user before downloading
+      autoUpdater.autoInstallOnAppQuit = false; // Ask user before installing
+
+      return autoUpdater;
+    },
+    (error: unknown) => {
+      autoUpdaterModule = undefined;
+      throw error;
+    }
+  );
+  return autoUpdaterModule;
+}
 
 /**
  * Check for updates
@@ -56,6 +87,7 @@ export async function checkForUpdates(manual: boolean = false): Promise<UpdateCh
     logger.info('Lifecycle', 'Checking for updates', { manual });
 
     // Check if update is available
+    const autoUpdater = await loadAutoUpdater();
     const updateInfo = await autoUpdater.checkForUpdates();
 
     if (!updateInfo) {
@@ -104,6 +136,7 @@ export async function downloadAndInstallUpdate(): Promise<void> {
     logger.info('Lifecycle', 'Downloading update');
 
     // Download update
+    const autoUpdater = await loadAutoUpdater();
     await autoUpdater.downloadUpdate();
 
     logger.info('Lifecycle', 'Update downloaded, ready to install');
@@ -159,9 +192,40 @@ export function initializeLifecycle(mainWindow: BrowserWindow): void {
   });
 
   /**
-   * Auto-updater events
+   * Auto-updater events (registered once the updater module has loaded)
    */
+  loadAutoUpdater()
+    .then((autoUpdater) => registerUpdaterEvents(autoUpdater, mainWindow))
+    .catch((error) => {
+      logger.error('Lifecycle', 'Failed to load auto-updater', {
+        error: error instanceof Error ? error.message : String(error),
+      });
+    });
+
+  /**
+   * Mode change event
+   * Re-evaluate auto-update policy when mode changes
+   */
+  modeManager.on('mode-changed', (event: ModeSwitchEvent) => {
+    const newMode = event.to;
+
+    logger.info('Lifecycle', 'Mode changed', {
+      from: event.from,
+      to: newMode,
+    });
+
+    // Note: We don't automatically trigger update checks on mode switch
+    // Users can manually check in Settings if needed
+  });
+}
 
+/**
+ * Forward auto-updater events to the renderer
+ *
+ * @param autoUpdater - Loaded autoUpdater instance
+ * @param mainWindow - Main BrowserWindow instance
+ */
+function registerUpdaterEvents(autoUpdater: AutoUpdater, mainWindow: BrowserWindow): void {
   // Update available
   autoUpdater.on('update-available', (info: UpdateInfo) => {
     logger.info('Lifecycle', 'Update available event', {
@@ -218,22 +282,6 @@ export function initializeLifecycle(mainWindow: BrowserWindow): void {
       });
     }
   });
-
-  /**
-   * Mode change event
-   * Re-evaluate auto-update policy when mode changes
-   */
-  modeManager.on('mode-changed', (event: ModeSwitchEvent) => {
-    const newMode = event.to;
-
-    logger.info('Lifecycle', 'Mode changed', {
-      from: event.from,
-      to: newMode,
-    });
-
-    // Note: We don't automatically trigger update checks on mode switch
-    // Users can manually check in Settings if needed
-  });
 }
 
 /**
@@ -308,21 +356,27 @@ export function getAppVersion(): string {
   return app.getVersion();
 }
 
+/**
+ * Platform, architecture and Node version never change while the process
+ * runs, so they are captured once at module load
+ */
+const PLATFORM_INFO = Object.freeze({
+  platform: process.platform,
+  arch: process.arch,
+  version: process.version,
+});
+
 /**
  * Get current platform information
  *
- * @returns Platform info for update compatibility
+ * @returns Platform info for update compatibility (shared, read-only)
  */
-export function getPlatformInfo(): {
+export function getPlatformInfo(): Readonly<{
   platform: NodeJS.Platform;
   arch: string;
   version: string;
-} {
-  return {
-    platform: process.platform,
-    arch: process.arch,
-    version: process.version,
-  };
+}> {
+  return PLATFORM_INFO;
 }
 
 export default {
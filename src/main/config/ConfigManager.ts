@@ -11,15 +11,48 @@ function getKeyStorageDir(): string {
 }
 
 /** Path for encrypted encryption key file */
-function getEncryptionKeyPath(): string {
-  return path.join(getKeyStorageDir(), 'encryption.key');
+function getEncryptionKeyPath(keyDir: string = getKeyStorageDir()): string {
+  return path.join(keyDir, 'encryption.key');
 }
 
 /** Path for encrypted HMAC key file */
-function getHmacKeyPath(): string {
-  return path.join(getKeyStorageDir(), 'hmac.key');
+function getHmacKeyPath(keyDir: string = getKeyStorageDir()): string {
+  return path.join(keyDir, 'hmac.key');
 }
 
+/**
+ * Read a key file, or return null if it does not exist yet
+ *
+ * One open() instead of an existence check followed by a read.
+ */
+function readKeyFile(keyPath: string): Buffer | null {
+  try {
+    return fs.readFileSync(keyPath);
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+      return null;
+    }
+    throw error;
+  }
+}
+
+/**
+ * Default configuration values
+ *
+ * Built once at module load and frozen so getDefaults() can hand out the
+ * same instance on every call.
+ */
+const DEFAULT_CONFIG: Readonly<Record<string, any>> = Object.freeze({
+  'llm.mode': 'remote', // Default to remote mode per FR-031
+  'llm.localEndpoint': 'http://localhost:11434',
+  'storage.retentionDays': 90,
+  'storage.feedbackRetentionDays': 30,
+  'update.autoCheck': true,
+  'update.lastCheck': null,
+  'ui.theme': 'system',
+  'ui.language': 'zh-CN',
+});
+
 /**
  * Configuration Manager with device-bound encryption
  *
@@ -35,6 +68,21 @@ export class ConfigManager {
   private static hmacKey: CryptoKey | null = null;
   private static isInitialized = false;
 
+  /**
+   * Decrypted config values as JSON text, keyed by config_key (null until loaded)
+   *
+   * Filled by one full read of user_config and updated in place by
+   * set/delete/clearAll, so each value is decrypted once per process. Values
+   * that fail to decrypt are held as 'null'.
+   */
+  private static valueCache: Map<string, string> | null = null;
+
+  /** Full load in flight; writes clear it so a load that read older rows is discarded */
+  private static cacheLoad: Promise<Map<string, string>> | null = null;
+
+  /** Database connection the cached values were read from */
+  private static cacheSource: ReturnType<typeof DatabaseManager.getDatabase> | null = null;
+
   /**
    * Initialize config manager
    * - Generates or loads encryption key from safeStorage
@@ -50,19 +98,18 @@ export class ConfigManager {
         throw new Error('SafeStorage encryption is not available on this system');
       }
 
+      // Resolve userData once and derive both key paths from it
       const keyDir = getKeyStorageDir();
-      const encryptionKeyPath = getEncryptionKeyPath();
-      const hmacKeyPath = getHmacKeyPath();
+      const encryptionKeyPath = getEncryptionKeyPath(keyDir);
+      const hmacKeyPath = getHmacKeyPath(keyDir);
 
-      // Ensure key directory exists
-      if (!fs.existsSync(keyDir)) {
-        fs.mkdirSync(keyDir, { recursive: true });
-      }
+      // Ensure key directory exists (no-op if it already does)
+      fs.mkdirSync(keyDir, { recursive: true });
 
       // Load or generate encryption key (using Electron safeStorage + file)
-      if (fs.existsSync(encryptionKeyPath)) {
-        const encrypted = fs.readFileSync(encryptionKeyPath);
-        const plain = safeStorage.decryptString(encrypted);
+      const storedEncryptionKey = readKeyFile(encryptionKeyPath);
+      if (storedEncryptionKey) {
+        const plain = safeStorage.decryptString(storedEncryptionKey);
         this.encryptionKey = await encryption.importKey(plain);
       } else {
         this.encryptionKey = await encryption.generateKey();
@@ -72,9 +119,9 @@ export class ConfigManager {
       }
 
       // Load or generate HMAC key
-      if (fs.existsSync(hmacKeyPath)) {
-        const encrypted = fs.readFileSync(hmacKeyPath);
-        const plain = safeStorage.decryptString(encrypted);
+      const storedHmacKey = readKeyFile(hmacKeyPath);
+      if (storedHmacKey) {
+        const plain = safeStorage.decryptString(storedHmacKey);
         this.hmacKey = await encryption.importHMACKey(plain);
       } else {
         this.hmacKey = await encryption.generateHMACKey();
@@ -93,27 +140,82 @@ export class ConfigManager {
   /**
    * Get configuration value(s)
    *
+   * The table is decrypted once per process and then served from memory;
+   * set/delete keep the cache in sync. Values are parsed from the cached JSON
+   * on every call, so callers may mutate the returned objects freely.
+   *
    * @param keys - Optional array of keys to retrieve (returns all if not specified)
    * @returns Decrypted config values
    */
   static async get(keys?: string[]): Promise<Record<string, any>> {
     await this.ensureInitialized();
+    const values = await this.loadCache();
+
+    const config: Record<string, any> = {};
+    const resultKeys = keys && keys.length > 0 ? keys : values.keys();
+
+    for (const key of resultKeys) {
+      const cached = values.get(key);
+      if (cached !== undefined) {
+        config[key] = JSON.parse(cached);
+      }
+    }
+
+    return config;
+  }
 
+  /**
+   * Drop cached values if the database connection has changed since they were read
+   */
+  private static syncCacheSource(): void {
     const db = DatabaseManager.getDatabase();
-    let query = 'SELECT config_key, config_value FROM user_config';
+    if (db !== this.cacheSource) {
+      this.valueCache = null;
+      this.cacheLoad = null;
+      this.cacheSource = db;
+    }
+  }
+
+  /**
+   * Return the cached values, reading the whole table on first use
+   *
+   * Concurrent callers share one load. If a write lands while it is
+   * decrypting, its result is discarded and the table is read again.
+   */
+  private static async loadCache(): Promise<Map<string, string>> {
+    for (;;) {
+      this.syncCacheSource();
+      if (this.valueCache) {
+        return this.valueCache;
+      }
 
-    const params: string[] = [];
-    if (keys && keys.length > 0) {
-      query += ' WHERE config_key IN (' + keys.map(() => '?').join(',') + ')';
-      params.push(...keys);
+      const load = (this.cacheLoad ??= this.readAllValues());
+      try {
+        const values = await load;
+        if (this.cacheLoad === load) {
+          this.valueCache = values;
+          this.cacheLoad = null;
+        }
+      } catch (error) {
+        if (this.cacheLoad === load) {
+          this.cacheLoad = null;
+        }
+        throw error;
+      }
     }
+  }
 
-    const rows = db.prepare(query).all(...params) as Array<{
-      config_key: string;
-      config_value: string | Buffer;
-    }>;
+  /**
+   * Read and decrypt every config row
+   *
+   * @returns JSON text keyed by config_key ('null' where decryption failed)
+   */
+  private static async readAllValues(): Promise<Map<string, string>> {
+    const rows = DatabaseManager.getDatabase()
+      .prepare('SELECT config_key, config_value FROM user_config')
+      .all() as Array<{ config_key: string; config_value: string | Buffer }>;
 
-    const config: Record<string, any> = {};
+    const values = new Map<string, string>();
 
     for (const row of rows) {
       try {
@@ -124,14 +226,15 @@ export class ConfigManager {
           this.encryptionKey!,
           configValueStr
         );
-        config[row.config_key] = JSON.parse(decrypted);
+        JSON.parse(decrypted); // Reject malformed values before caching
+        values.set(row.config_key, decrypted);
       } catch (error) {
         console.error(`Failed to decrypt config key: ${row.config_key}`, error);
-        config[row.config_key] = null;
+        values.set(row.config_key, 'null');
       }
     }
 
-    return config;
+    return values;
   }
 
   /**
@@ -144,7 +247,7 @@ export class ConfigManager {
     await this.ensureInitialized();
 
     const db = DatabaseManager.getDatabase();
-    const entries: Array<{ key: string; encrypted: string }> = [];
+    const entries: Array<{ key: string; encrypted: string; jsonValue: string }> = [];
 
     for (const [key, value] of Object.entries(updates)) {
       const jsonValue = JSON.stringify(value);
@@ -153,28 +256,30 @@ export class ConfigManager {
         jsonValue
       );
       await encryption.hmacSha256(this.hmacKey!, jsonValue);
-      entries.push({ key, encrypted });
+      entries.push({ key, encrypted, jsonValue });
     }
 
     DatabaseManager.transaction(() => {
+      // One upsert per key instead of a SELECT followed by UPDATE or INSERT
+      const upsert = db.prepare(`
+        INSERT INTO user_config (config_key, config_value, updated_at)
+        VALUES (?, ?, strftime('%s', 'now'))
+        ON CONFLICT(config_key) DO UPDATE SET
+          config_value = excluded.config_value,
+          updated_at = excluded.updated_at
+      `);
+
       for (const { key, encrypted } of entries) {
-        const existing = db
-          .prepare('SELECT config_key FROM user_config WHERE config_key = ?')
-          .get(key);
-
-        const blob = Buffer.from(encrypted, 'utf8');
-        if (existing) {
-          db.prepare(
-            "UPDATE user_config SET config_value = ?, updated_at = strftime('%s', 'now') WHERE config_key = ?"
-          ).run(blob, key);
-        } else {
-          db.prepare(
-            "INSERT INTO user_config (config_key, config_value, updated_at) VALUES (?, ?, strftime('%s', 'now'))"
-          ).run(key, blob);
-        }
+        upsert.run(key, Buffer.from(encrypted, 'utf8'));
       }
     });
 
+    this.syncCacheSource();
+    this.cacheLoad = null;
+    for (const { key, jsonValue } of entries) {
+      this.valueCache?.set(key, jsonValue);
+    }
+
     return entries.map((e) => e.key);
   }
 
@@ -190,6 +295,12 @@ export class ConfigManager {
     const placeholders = keys.map(() => '?').join(',');
 
     db.prepare(`DELETE FROM user_config WHERE config_key IN (${placeholders})`).run(...keys);
+
+    this.syncCacheSource();
+    this.cacheLoad = null;
+    for (const key of keys) {
+      this.valueCache?.delete(key);
+    }
   }
 
   /**
@@ -211,18 +322,11 @@ export class ConfigManager {
 
   /**
    * Get default configuration
+   *
+   * @returns Shared, frozen defaults object (do not mutate)
    */
-  static getDefaults(): Record<string, any> {
-    return {
-      'llm.mode': 'remote', // Default to remote mode per FR-031
-      'llm.localEndpoint': 'http://localhost:11434',
-      'storage.retentionDays': 90,
-      'storage.feedbackRetentionDays': 30,
-      'update.autoCheck': true,
-      'update.lastCheck': null,
-      'ui.theme': 'system',
-      'ui.language': 'zh-CN',
-    };
+  static getDefaults(): Readonly<Record<string, any>> {
+    return DEFAULT_CONFIG;
   }
 
   /**
@@ -262,6 +366,9 @@ export class ConfigManager {
   static async clearAll(): Promise<void> {
     const db = DatabaseManager.getDatabase();
     db.prepare('DELETE FROM user_config').run();
+    this.syncCacheSource();
+    this.cacheLoad = null;
+    this.valueCache = new Map();
   }
 
   /**
@@ -3,7 +3,8 @@
  *
  * Structured logging for mailCopilot application
  * Features:
- * - Structured JSON output (error type, module, message, timestamp, context)
+ * - Structured JSON output (error type, module, message, timestamp, context),
+ *   serialized once per call as a single line
  * - Log levels: DEBUG, INFO, WARN, ERROR
  * - File and console output with automatic log rotation
  * - Cross-platform path handling
@@ -51,6 +52,37 @@ function initializeLogger(): void {
 // Initialize logger on module load
 initializeLogger();
 
+/**
+ * JSON replacer for log context values that JSON.stringify would drop or reject
+ */
+function logValueReplacer(_key: string, value: unknown): unknown {
+  if (value instanceof Error) {
+    return { name: value.name, message: value.message, stack: value.stack };
+  }
+  if (typeof value === 'bigint') {
+    return value.toString();
+  }
+  return value;
+}
+
+/**
+ * Serialize a structured log entry to a single JSON line
+ *
+ * Done once per call so every transport writes the same string, instead of
+ * each transport inspecting the entry object separately. Entries that cannot
+ * be serialized (e.g. circular context) are passed through unchanged.
+ *
+ * @param entry - Structured log entry
+ * @returns JSON line, or the entry itself if serialization fails
+ */
+function toLogLine(entry: Record<string, any>): string | Record<string, any> {
+  try {
+    return JSON.stringify(entry, logValueReplacer);
+  } catch {
+    return entry;
+  }
+}
+
 /**
  * Structured logging helper
  * Provides consistent logging interface across the application
@@ -63,13 +95,15 @@ export const logger = {
    * @param context - Additional context metadata
    */
   debug: (module: string, message: string, context?: Record<string, any>) => {
-    log.debug({
-      level: 'DEBUG',
-      module,
-      message,
-      timestamp: Date.now(),
-      ...context,
-    });
+    log.debug(
+      toLogLine({
+        level: 'DEBUG',
+        module,
+        message,
+        timestamp: Date.now(),
+        ...context,
+      })
+    );
   },
 
   /**
@@ -79,13 +113,15 @@ export const logger = {
    * @param context - Additional context metadata
    */
   info: (module: string, message: string, context?: Record<string, any>) => {
-    log.info({
-      level: 'INFO',
-      module,
-      message,
-      timestamp: Date.now(),
-      ...context,
-    });
+    log.info(
+      toLogLine({
+        level: 'INFO',
+        module,
+        message,
+        timestamp: Date.now(),
+        ...context,
+      })
+    );
   },
 
   /**
@@ -95,13 +131,15 @@ export const logger = {
    * @param context - Additional context metadata
    */
   warn: (module: string, message: string, context?: Record<string, any>) => {
-    log.warn({
-      level: 'WARN',
-      module,
-      message,
-      timestamp: Date.now(),
-      ...context,
-    });
+    log.warn(
+      toLogLine({
+        level: 'WARN',
+        module,
+        message,
+        timestamp: Date.now(),
+        ...context,
+      })
+    );
   },
 
   /**
@@ -129,14 +167,16 @@ export const logger = {
       errorData.error = String(error);
     }
 
-    log.error({
-      level: 'ERROR',
-      module,
-      message,
-      timestamp: Date.now(),
-      ...errorData,
-      ...context,
-    });
+    log.error(
+      toLogLine({
+        level: 'ERROR',
+        module,
+        message,
+        timestamp: Date.now(),
+        ...errorData,
+        ...context,
+      })
+    );
   },
 };
 
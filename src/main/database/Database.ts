@@ -4,6 +4,37 @@ import { app } from 'electron';
 import fs from 'fs';
 import { logger } from '../config/logger.js';
 
+/**
+ * PRAGMAs applied to every new connection, as a single script
+ */
+const CONNECTION_PRAGMAS = `
+  PRAGMA page_size = 4096;
+  PRAGMA journal_mode = WAL;
+  PRAGMA synchronous = NORMAL;
+  PRAGMA foreign_keys = ON;
+  PRAGMA temp_store = MEMORY;
+  PRAGMA mmap_size = 30000000000;
+  PRAGMA cache_size = -64000; -- 64MB cache
+`;
+
+/**
+ * Size of a file in bytes, or 0 if it does not exist
+ *
+ * One stat call instead of an existsSync probe followed by statSync.
+ */
+function fileSizeOrZero(filePath: string): number {
+  return fs.statSync(filePath, { throwIfNoEntry: false })?.size ?? 0;
+}
+
+/**
+ * Prepared statements keyed by SQL text, per connection
+ *
+ * better-sqlite3 has no statement cache of its own, so every db.prepare()
+ * re-parses the SQL. Keyed by connection so a closed or replaced database
+ * never hands out statements bound to the old handle.
+ */
+const statementCache = new WeakMap<Database.Database, Map<string, Database.Statement>>();
+
 /**
  * Database connection wrapper for better-sqlite3
  *
@@ -31,9 +62,8 @@ class DatabaseManager {
     const userDataPath = app.getPath('userData');
     const dataDir = path.join(userDataPath, '.mailcopilot');
 
-    if (!fs.existsSync(dataDir)) {
-      fs.mkdirSync(dataDir, { recursive: true });
-    }
+    // recursive mkdir is a no-op when the directory already exists
+    fs.mkdirSync(dataDir, { recursive: true });
 
     this.dbPath = path.join(dataDir, 'app.db');
 
@@ -42,16 +72,10 @@ class DatabaseManager {
       verbose: process.env.LOG_LEVEL === 'DEBUG' ? console.log : undefined,
     });
 
-    // Enable WAL mode for better concurrent access
-    this.instance.pragma('journal_mode = WAL');
-    this.instance.pragma('synchronous = NORMAL');
-    this.instance.pragma('foreign_keys = ON');
-    this.instance.pragma('temp_store = MEMORY');
-
-    // Performance optimizations
-    this.instance.pragma('mmap_size = 30000000000');
-    this.instance.pragma('page_size = 4096');
-    this.instance.pragma('cache_size = -64000'); // 64MB cache
+    // Connection setup runs once per process; later initialize() calls reuse
+    // this warmed connection. page_size must precede journal_mode: it cannot
+    // change once a database is in WAL mode.
+    this.instance.exec(CONNECTION_PRAGMAS);
 
     return this.instance;
   }
@@ -71,6 +95,7 @@ class DatabaseManager {
    */
   static close(): void {
     if (this.instance) {
+      statementCache.delete(this.instance);
       this.instance.close();
       this.instance = null;
     }
@@ -89,10 +114,25 @@ class DatabaseManager {
 
   /**
    * Prepare and cache a statement for reuse
+   *
+   * Repeated calls with the same SQL text return the statement compiled on
+   * the first call instead of preparing it again.
    */
   static prepare(sql: string): Database.Statement {
     const db = this.getDatabase();
-    return db.prepare(sql);
+
+    let statements = statementCache.get(db);
+    if (!statements) {
+      statements = new Map();
+      statementCache.set(db, statements);
+    }
+
+    let stmt = statements.get(sql);
+    if (!stmt) {
+      stmt = db.prepare(sql);
+      statements.set(sql, stmt);
+    }
+    return stmt;
   }
 
   /**
@@ -122,11 +162,7 @@ class DatabaseManager {
    * Get database size in bytes
    */
   static getSize(): number {
-    if (!fs.existsSync(this.dbPath)) {
-      return 0;
-    }
-    const stats = fs.statSync(this.dbPath);
-    return stats.size;
+    return fileSizeOrZero(this.dbPath);
   }
 
   /**
@@ -152,11 +188,7 @@ class DatabaseManager {
     const pageSize = db.pragma('page_size', { simple: true }) as number;
     const pageCount = db.pragma('page_count', { simple: true }) as number;
 
-    const walPath = `${this.dbPath}-wal`;
-    let walSize = 0;
-    if (fs.existsSync(walPath)) {
-      walSize = fs.statSync(walPath).size;
-    }
+    const walSize = fileSizeOrZero(`${this.dbPath}-wal`);
 
     return {
       path: this.dbPath,
@@ -197,21 +229,22 @@ class DatabaseManager {
       { table: 'daily_reports', index: 'idx_generation_mode' },
     ];
 
-    const results = expectedIndexes.map(({ table, index }) => {
-      // Check if index exists using sqlite_master
-      const checkStmt = db.prepare(`
-        SELECT COUNT(*) as count
-        FROM sqlite_master
-        WHERE type = 'index'
-        AND name = ?
-        AND tbl_name = ?
-      `);
-
-      const result = checkStmt.get(index, table) as { count: number };
-      const exists = result.count > 0;
-
-      return { table, index, exists };
-    });
+    // Read every index from sqlite_master in one query instead of preparing
+    // and running a lookup per expected index
+    const existing = new Set(
+      (
+        db.prepare(`SELECT name, tbl_name FROM sqlite_master WHERE type = 'index'`).all() as Array<{
+          name: string;
+          tbl_name: string;
+        }>
+      ).map((row) => `${row.tbl_name}.${row.name}`)
+    );
+
+    const results = expectedIndexes.map(({ table, index }) => ({
+      table,
+      index,
+      exists: existing.has(`${table}.${index}`),
+    }));
 
     const allExist = results.every((r) => r.exists);
 
@@ -281,11 +314,7 @@ class DatabaseManager {
     // Get WAL checkpoint status
     const walCheckpointResult = db.pragma('wal_checkpoint(TRUNCATE)', { simple: true }) as number;
 
-    const walPath = `${this.dbPath}-wal`;
-    let walSize = 0;
-    if (fs.existsSync(walPath)) {
-      walSize = fs.statSync(walPath).size;
-    }
+    const walSize = fileSizeOrZero(`${this.dbPath}-wal`);
 
     return {
       cacheSize: Math.abs(cacheSize) * 1024, // Convert from pages to bytes (assuming 4KB pages)
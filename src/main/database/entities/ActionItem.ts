@@ -51,6 +51,22 @@ export enum SourceStatus {
   UNVERIFIED = 'unverified',
 }
 
+/**
+ * Reverse lookups from stored/LLM string values to enum members
+ *
+ * String enum members already equal their values, so these only exist to
+ * narrow plain strings without a per-row ternary chain or Object.values() scan.
+ */
+export const ITEM_TYPE_BY_VALUE: Readonly<Record<`${ItemType}`, ItemType>> = Object.freeze({
+  completed: ItemType.COMPLETED,
+  pending: ItemType.PENDING,
+});
+
+export const SOURCE_STATUS_BY_VALUE: Readonly<Record<`${SourceStatus}`, SourceStatus>> = Object.freeze({
+  verified: SourceStatus.VERIFIED,
+  unverified: SourceStatus.UNVERIFIED,
+});
+
 /**
  * Feedback type enum for user error reporting
  *
@@ -131,24 +147,38 @@ export interface DecryptedActionItem {
 export class ActionItemRepository {
   private static readonly TABLE_NAME = 'todo_items';
 
+  private static readonly INSERT_SQL = `
+    INSERT INTO ${ActionItemRepository.TABLE_NAME} (
+      item_id,
+      report_date,
+      content_encrypted,
+      content_checksum,
+      item_type,
+      tags,
+      created_at,
+      is_manually_edited,
+      source_status,
+      confidence_score,
+      feedback_type
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+  `;
+
   /**
-   * Create a new action item record
+   * Build the positional parameters for INSERT_SQL
    *
-   * Content is encrypted using AES-256-GCM before storage.
-   * Feedback type is also encrypted per plan v2.7.
-   * SHA-256 checksum is computed for tamper detection.
+   * Content (and feedback_type, per plan v2.7) is encrypted using AES-256-GCM
+   * and a SHA-256 checksum is computed for tamper detection.
    *
    * @param item_id - UUID for the item
    * @param data - Action item data (content will be encrypted)
-   * @returns The created action item record
-   * @throws Error if insertion fails
+   * @param now - Unix timestamp used when data.created_at is not set
+   * @returns Parameters in INSERT_SQL column order
    */
-  static async create(item_id: string, data: ActionItemData): Promise<ActionItem> {
-    const db = DatabaseManager.getDatabase();
-
-    const now = Math.floor(Date.now() / 1000);
-    const created_at = data.created_at ?? now;
-
+  private static async toInsertRow(
+    item_id: string,
+    data: ActionItemData,
+    now: number
+  ): Promise<unknown[]> {
     // Encrypt content
     const content_encrypted_json = await ConfigManager.encryptField(data.content);
     const content_encrypted = Buffer.from(content_encrypted_json, 'utf-8');
@@ -164,42 +194,41 @@ export class ActionItemRepository {
       feedback_encrypted = Buffer.from(feedback_encrypted_json, 'utf-8');
     }
 
-    // Convert tags array to JSON string
-    const tags_json = JSON.stringify(data.tags ?? []);
-
-    // Convert boolean to integer (0 or 1)
-    const is_manually_edited = (data.is_manually_edited ?? false) ? 1 : 0;
+    return [
+      item_id,
+      data.report_date,
+      content_encrypted,
+      content_checksum,
+      data.item_type,
+      // Convert tags array to JSON string
+      JSON.stringify(data.tags ?? []),
+      data.created_at ?? now,
+      // Convert boolean to integer (0 or 1)
+      (data.is_manually_edited ?? false) ? 1 : 0,
+      data.source_status ?? SourceStatus.VERIFIED,
+      data.confidence_score ?? 0.0,
+      feedback_encrypted,
+    ];
+  }
 
-    const stmt = db.prepare(`
-      INSERT INTO ${this.TABLE_NAME} (
-        item_id,
-        report_date,
-        content_encrypted,
-        content_checksum,
-        item_type,
-        tags,
-        created_at,
-        is_manually_edited,
-        source_status,
-        confidence_score,
-        feedback_type
-      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    `);
+  /**
+   * Create a new action item record
+   *
+   * Content is encrypted using AES-256-GCM before storage.
+   * Feedback type is also encrypted per plan v2.7.
+   * SHA-256 checksum is computed for tamper detection.
+   *
+   * @param item_id - UUID for the item
+   * @param data - Action item data (content will be encrypted)
+   * @returns The created action item record
+   * @throws Error if insertion fails
+   */
+  static async create(item_id: string, data: ActionItemData): Promise<ActionItem> {
+    const row = await this.toInsertRow(item_id, data, Math.floor(Date.now() / 1000));
+    const stmt = DatabaseManager.prepare(this.INSERT_SQL);
 
     try {
-      stmt.run(
-        item_id,
-        data.report_date,
-        content_encrypted,
-        content_checksum,
-        data.item_type,
-        tags_json,
-        created_at,
-        is_manually_edited,
-        data.source_status ?? SourceStatus.VERIFIED,
-        data.confidence_score ?? 0.0,
-        feedback_encrypted
-      );
+      stmt.run(...row);
 
       logger.info('ActionItem', `Created action item: ${item_id}`, {
         item_id,
@@ -227,9 +256,7 @@ export class ActionItemRepository {
    * @returns Action item record or null if not found
    */
   static findById(item_id: string): ActionItem | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         item_id,
         report_date,
@@ -248,10 +275,19 @@ export class ActionItemRepository {
 
     const row = stmt.get(item_id) as ActionItem | undefined;
 
-    if (!row) {
-      return null;
-    }
+    return row ? this.fromRow(row) : null;
+  }
 
+  /**
+   * Convert a raw todo_items row to an ActionItem in place
+   *
+   * better-sqlite3 returns a fresh object per row, so the column conversions
+   * are applied to it directly rather than copying it into a new object.
+   *
+   * @param row - Row as returned by the driver (tags as JSON, flag as 0/1)
+   * @returns The same row with parsed tags and a boolean edit flag
+   */
+  private static fromRow(row: ActionItem): ActionItem {
     // Parse tags JSON to array
     row.tags = this.parseTags(row.tags as unknown as string);
 
@@ -274,6 +310,19 @@ export class ActionItemRepository {
       return null;
     }
 
+    return this.decryptItem(item);
+  }
+
+  /**
+   * Decrypt an already loaded action item and verify its checksum
+   *
+   * @param item - Action item as returned by findById/findByReportDate
+   * @returns Decrypted action item
+   * @throws Error if the content checksum does not match
+   */
+  private static async decryptItem(item: ActionItem): Promise<DecryptedActionItem> {
+    const item_id = item.item_id;
+
     // Verify content checksum
     const content = await ConfigManager.decryptField(item.content_encrypted);
     const checksum = crypto.createHash('sha256').update(content).digest('hex');
@@ -321,9 +370,7 @@ export class ActionItemRepository {
    * @returns Array of action items (encrypted)
    */
   static findByReportDate(report_date: string): ActionItem[] {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         item_id,
         report_date,
@@ -341,13 +388,13 @@ export class ActionItemRepository {
       ORDER BY created_at DESC
     `);
 
-    const rows = stmt.all(report_date) as ActionItem[];
-
-    return rows.map((row) => ({
-      ...row,
-      tags: this.parseTags(row.tags as unknown as string),
-      is_manually_edited: Boolean(row.is_manually_edited),
-    }));
+    // Build the result while stepping the cursor instead of materializing
+    // every row first and mapping into a second array
+    const items: ActionItem[] = [];
+    for (const row of stmt.iterate(report_date) as IterableIterator<ActionItem>) {
+      items.push(this.fromRow(row));
+    }
+    return items;
   }
 
   /**
@@ -361,12 +408,10 @@ export class ActionItemRepository {
 
     const decrypted: DecryptedActionItem[] = [];
 
+    // Decrypt the rows already loaded instead of re-querying each item by ID
     for (const item of items) {
       try {
-        const decryptedItem = await this.findByIdDecrypted(item.item_id);
-        if (decryptedItem) {
-          decrypted.push(decryptedItem);
-        }
+        decrypted.push(await this.decryptItem(item));
       } catch (error) {
         logger.error('ActionItem', `Failed to decrypt item: ${item.item_id}`, {
           item_id: item.item_id,
@@ -389,14 +434,12 @@ export class ActionItemRepository {
    * @returns Updated action item or null if not found
    */
   static async updateContent(item_id: string, content: string): Promise<ActionItem | null> {
-    const db = DatabaseManager.getDatabase();
-
     // Encrypt new content
     const content_encrypted_json = await ConfigManager.encryptField(content);
     const content_encrypted = Buffer.from(content_encrypted_json, 'utf-8');
     const content_checksum = crypto.createHash('sha256').update(content).digest('hex');
 
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET content_encrypted = ?,
           content_checksum = ?,
@@ -425,9 +468,7 @@ export class ActionItemRepository {
    * @returns Updated action item or null if not found
    */
   static updateType(item_id: string, item_type: ItemType): ActionItem | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET item_type = ?
       WHERE item_id = ?
@@ -461,9 +502,7 @@ export class ActionItemRepository {
     confidence_score: number,
     source_status: SourceStatus
   ): ActionItem | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET confidence_score = ?, source_status = ?
       WHERE item_id = ?
@@ -499,8 +538,6 @@ export class ActionItemRepository {
     is_correct: boolean,
     feedback_type?: FeedbackType
   ): Promise<ActionItem | null> {
-    const db = DatabaseManager.getDatabase();
-
     // If marked correct, clear feedback_type
     // If marked incorrect, encrypt and set feedback_type
     let feedback_encrypted: Buffer | null = null;
@@ -509,7 +546,7 @@ export class ActionItemRepository {
       feedback_encrypted = Buffer.from(feedback_encrypted_json, 'utf-8');
     }
 
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET feedback_type = ?
       WHERE item_id = ?
@@ -538,9 +575,7 @@ export class ActionItemRepository {
    * @returns True if deleted, false if not found
    */
   static delete(item_id: string): boolean {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE item_id = ?`);
+    const stmt = DatabaseManager.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE item_id = ?`);
     const result = stmt.run(item_id);
 
     if (result.changes > 0) {
@@ -559,9 +594,7 @@ export class ActionItemRepository {
    * @returns Total number of action items
    */
   static count(): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`SELECT COUNT(*) as count FROM ${this.TABLE_NAME}`);
+    const stmt = DatabaseManager.prepare(`SELECT COUNT(*) as count FROM ${this.TABLE_NAME}`);
     const result = stmt.get() as { count: number };
     return result.count;
   }
@@ -573,9 +606,7 @@ export class ActionItemRepository {
    * @returns Count of action items with the given type
    */
   static countByType(item_type: ItemType): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(
+    const stmt = DatabaseManager.prepare(
       `SELECT COUNT(*) as count FROM ${this.TABLE_NAME} WHERE item_type = ?`
     );
     const result = stmt.get(item_type) as { count: number };
@@ -589,9 +620,7 @@ export class ActionItemRepository {
    * @returns Count of action items with the given status
    */
   static countBySourceStatus(source_status: SourceStatus): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(
+    const stmt = DatabaseManager.prepare(
       `SELECT COUNT(*) as count FROM ${this.TABLE_NAME} WHERE source_status = ?`
     );
     const result = stmt.get(source_status) as { count: number };
@@ -607,9 +636,7 @@ export class ActionItemRepository {
    * @returns Number of deleted action items
    */
   static deleteOlderThan(older_than: number): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE created_at < ?`);
+    const stmt = DatabaseManager.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE created_at < ?`);
     const result = stmt.run(older_than);
 
     logger.info('ActionItem', `Deleted ${result.changes} action items older than ${older_than}`, {
@@ -625,31 +652,55 @@ export class ActionItemRepository {
    *
    * Per plan.md: Use transaction wrapping for bulk inserts to improve performance
    *
-   * NOTE: This method is a simplified implementation. For production use with encryption,
-   * items should be pre-encrypted before calling this method, or use individual create()
-   * calls wrapped in a transaction.
+   * Items are encrypted before the transaction opens, then inserted with a single
+   * prepared statement so the whole batch costs one commit. Items that fail to
+   * encrypt or insert are logged and skipped.
    *
    * @param items - Array of {item_id, data} tuples
    * @returns Array of created item IDs
    */
   static async batchCreate(items: Array<{ item_id: string; data: ActionItemData }>): Promise<string[]> {
-    const created: string[] = [];
+    const now = Math.floor(Date.now() / 1000);
 
-    for (const { item_id, data } of items) {
-      try {
-        // Create each item individually (with encryption)
-        // Note: This is not ideal for bulk operations but ensures encryption works
-        // For true bulk operations, we'd need to refactor the encryption layer
-        await this.create(item_id, data);
-        created.push(item_id);
-      } catch (error) {
-        logger.error('ActionItem', `Failed to create action item in batch: ${item_id}`, {
-          item_id,
-          error: error instanceof Error ? error.message : String(error),
-        });
-        // Continue with next item (batch partial failure handling)
+    // Encrypt every item up front; the transaction below must stay synchronous
+    const rows = await Promise.all(
+      items.map(async ({ item_id, data }) => {
+        try {
+          return await this.toInsertRow(item_id, data, now);
+        } catch (error) {
+          logger.error('ActionItem', `Failed to encrypt action item in batch: ${item_id}`, {
+            item_id,
+            error: error instanceof Error ? error.message : String(error),
+          });
+          return null;
+        }
+      })
+    );
+
+    const created = DatabaseManager.transaction((db) => {
+      const stmt = db.prepare(this.INSERT_SQL);
+      const inserted: string[] = [];
+
+      for (const row of rows) {
+        if (!row) {
+          continue;
+        }
+
+        const item_id = row[0] as string;
+        try {
+          stmt.run(...row);
+          inserted.push(item_id);
+        } catch (error) {
+          logger.error('ActionItem', `Failed to create action item in batch: ${item_id}`, {
+            item_id,
+            error: error instanceof Error ? error.message : String(error),
+          });
+          // Continue with next item (batch partial failure handling)
+        }
       }
-    }
+
+      return inserted;
+    });
 
     logger.info('ActionItem', `Batch created ${created.length}/${items.length} action items`, {
       created: created.length,
@@ -82,11 +82,9 @@ export class EmailSourceRepository {
    * @throws Error if insertion fails (e.g., duplicate email_hash)
    */
   static create(email_hash: string, data: EmailSourceData): EmailSource {
-    const db = DatabaseManager.getDatabase();
-
     const now = Math.floor(Date.now() / 1000);
 
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       INSERT INTO ${this.TABLE_NAME} (
         email_hash,
         processed_at,
@@ -135,9 +133,7 @@ export class EmailSourceRepository {
    * @returns Email source record or null if not found
    */
   static findByHash(email_hash: string): EmailSource | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         email_hash,
         processed_at,
@@ -163,14 +159,14 @@ export class EmailSourceRepository {
    * and skip creating new items, but log "跳过N封已处理邮件"
    *
    * @param email_hash - SHA-256 fingerprint
+   * @param now - Unix timestamp to record (defaults to current time)
    * @returns Updated email source or null if not found
    */
-  static updateLastSeen(email_hash: string): EmailSource | null {
-    const db = DatabaseManager.getDatabase();
-
-    const now = Math.floor(Date.now() / 1000);
-
-    const stmt = db.prepare(`
+  static updateLastSeen(
+    email_hash: string,
+    now: number = Math.floor(Date.now() / 1000)
+  ): EmailSource | null {
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET last_seen_at = ?
       WHERE email_hash = ?
@@ -204,9 +200,7 @@ export class EmailSourceRepository {
     extract_status: ExtractStatus,
     error_log?: string
   ): EmailSource | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET extract_status = ?, error_log = ?
       WHERE email_hash = ?
@@ -240,9 +234,7 @@ export class EmailSourceRepository {
     search_string: string,
     file_path: string
   ): EmailSource | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET search_string = ?, file_path = ?
       WHERE email_hash = ?
@@ -271,9 +263,7 @@ export class EmailSourceRepository {
    * @returns True if deleted, false if not found
    */
   static delete(email_hash: string): boolean {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE email_hash = ?`);
+    const stmt = DatabaseManager.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE email_hash = ?`);
     const result = stmt.run(email_hash);
 
     if (result.changes > 0) {
@@ -293,9 +283,7 @@ export class EmailSourceRepository {
    * @returns Array of email sources for the report
    */
   static findByReportDate(report_date: string): EmailSource[] {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         email_hash,
         processed_at,
@@ -321,9 +309,7 @@ export class EmailSourceRepository {
    * @returns Array of email sources with the given status
    */
   static findByExtractStatus(extract_status: ExtractStatus): EmailSource[] {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         email_hash,
         processed_at,
@@ -348,9 +334,7 @@ export class EmailSourceRepository {
    * @returns Total number of email sources
    */
   static count(): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`SELECT COUNT(*) as count FROM ${this.TABLE_NAME}`);
+    const stmt = DatabaseManager.prepare(`SELECT COUNT(*) as count FROM ${this.TABLE_NAME}`);
     const result = stmt.get() as { count: number };
     return result.count;
   }
@@ -362,9 +346,7 @@ export class EmailSourceRepository {
    * @returns Count of email sources with the given status
    */
   static countByStatus(extract_status: ExtractStatus): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(
+    const stmt = DatabaseManager.prepare(
       `SELECT COUNT(*) as count FROM ${this.TABLE_NAME} WHERE extract_status = ?`
     );
     const result = stmt.get(extract_status) as { count: number };
@@ -380,9 +362,7 @@ export class EmailSourceRepository {
    * @returns Number of deleted email sources
    */
   static deleteOlderThan(older_than: number): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(
+    const stmt = DatabaseManager.prepare(
       `DELETE FROM ${this.TABLE_NAME} WHERE processed_at < ?`
     );
     const result = stmt.run(older_than);
@@ -406,12 +386,52 @@ export class EmailSourceRepository {
   static batchCreate(
     emailSources: Array<{ email_hash: string; data: EmailSourceData }>
   ): EmailSource[] {
-    return DatabaseManager.transaction(() => {
+    const now = Math.floor(Date.now() / 1000);
+
+    return DatabaseManager.transaction((db) => {
       const created: EmailSource[] = [];
 
+      // One prepared statement for the whole batch; rows are built from the
+      // input rather than re-selected after each insert
+      const stmt = db.prepare(`
+        INSERT INTO ${this.TABLE_NAME} (
+          email_hash,
+          processed_at,
+          last_seen_at,
+          report_date,
+          attachments_meta,
+          extract_status,
+          error_log,
+          search_string,
+          file_path
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+      `);
+
       for (const { email_hash, data } of emailSources) {
+        const emailSource: EmailSource = {
+          email_hash,
+          processed_at: data.processed_at ?? now,
+          last_seen_at: data.last_seen_at ?? now,
+          report_date: data.report_date,
+          attachments_meta: data.attachments_meta ?? '[]',
+          extract_status: data.extract_status,
+          error_log: data.error_log,
+          search_string: data.search_string,
+          file_path: data.file_path,
+        };
+
         try {
-          const emailSource = this.create(email_hash, data);
+          stmt.run(
+            email_hash,
+            emailSource.processed_at,
+            emailSource.last_seen_at,
+            emailSource.report_date ?? null,
+            emailSource.attachments_meta,
+            emailSource.extract_status,
+            emailSource.error_log ?? null,
+            emailSource.search_string ?? null,
+            emailSource.file_path ?? null
+          );
           created.push(emailSource);
         } catch (error) {
           logger.error('EmailSource', `Failed to create email source in batch: ${email_hash}`, {
@@ -76,12 +76,10 @@ export class ItemEmailRefRepository {
    * @throws Error if insertion fails or foreign key constraints violated
    */
   static create(ref_id: string, data: ItemEmailRefData): ItemEmailRef {
-    const db = DatabaseManager.getDatabase();
-
     const now = Math.floor(Date.now() / 1000);
     const created_at = data.created_at ?? now;
 
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       INSERT INTO ${this.TABLE_NAME} (
         ref_id,
         item_id,
@@ -128,9 +126,7 @@ export class ItemEmailRefRepository {
    * @returns Item-email reference or null if not found
    */
   static findByRefId(ref_id: string): ItemEmailRef | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         ref_id,
         item_id,
@@ -156,9 +152,7 @@ export class ItemEmailRefRepository {
    * @returns Array of item-email references
    */
   static findByItemId(item_id: string): ItemEmailRef[] {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         ref_id,
         item_id,
@@ -183,9 +177,7 @@ export class ItemEmailRefRepository {
    * @returns Array of item-email references
    */
   static findByEmailHash(email_hash: string): ItemEmailRef[] {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         ref_id,
         item_id,
@@ -211,9 +203,7 @@ export class ItemEmailRefRepository {
    * @returns Array of item source references with email metadata
    */
   static findSourcesByItemId(item_id: string): ItemSourceRef[] {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         refs.ref_id,
         refs.item_id,
@@ -229,7 +219,7 @@ export class ItemEmailRefRepository {
       ORDER BY refs.confidence DESC, refs.created_at ASC
     `);
 
-    const rows = stmt.all(item_id) as Array<{
+    const rows = stmt.iterate(item_id) as IterableIterator<{
       ref_id: string;
       item_id: string;
       email_hash: string;
@@ -240,13 +230,19 @@ export class ItemEmailRefRepository {
       file_path: string;
     }>;
 
-    return rows.map((row) => ({
-      email_hash: row.email_hash,
-      search_string: row.search_string,
-      file_path: row.file_path,
-      evidence_text: row.evidence_text,
-      confidence: row.confidence,
-    }));
+    // Build the result while stepping the cursor instead of materializing
+    // every row first and mapping into a second array
+    const sources: ItemSourceRef[] = [];
+    for (const row of rows) {
+      sources.push({
+        email_hash: row.email_hash,
+        search_string: row.search_string,
+        file_path: row.file_path,
+        evidence_text: row.evidence_text,
+        confidence: row.confidence,
+      });
+    }
+    return sources;
   }
 
   /**
@@ -261,9 +257,7 @@ export class ItemEmailRefRepository {
    * @returns Updated item-email reference or null if not found
    */
   static update(ref_id: string, evidence_text: string, confidence: number): ItemEmailRef | null {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       UPDATE ${this.TABLE_NAME}
       SET evidence_text = ?, confidence = ?
       WHERE ref_id = ?
@@ -292,9 +286,7 @@ export class ItemEmailRefRepository {
    * @returns True if deleted, false if not found
    */
   static delete(ref_id: string): boolean {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE ref_id = ?`);
+    const stmt = DatabaseManager.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE ref_id = ?`);
     const result = stmt.run(ref_id);
 
     if (result.changes > 0) {
@@ -317,9 +309,7 @@ export class ItemEmailRefRepository {
    * @returns Number of deleted references
    */
   static deleteByItemId(item_id: string): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE item_id = ?`);
+    const stmt = DatabaseManager.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE item_id = ?`);
     const result = stmt.run(item_id);
 
     if (result.changes > 0) {
@@ -341,9 +331,7 @@ export class ItemEmailRefRepository {
    * @returns Number of deleted references
    */
   static deleteByEmailHash(email_hash: string): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE email_hash = ?`);
+    const stmt = DatabaseManager.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE email_hash = ?`);
     const result = stmt.run(email_hash);
 
     if (result.changes > 0) {
@@ -362,9 +350,7 @@ export class ItemEmailRefRepository {
    * @returns Total number of references
    */
   static count(): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`SELECT COUNT(*) as count FROM ${this.TABLE_NAME}`);
+    const stmt = DatabaseManager.prepare(`SELECT COUNT(*) as count FROM ${this.TABLE_NAME}`);
     const result = stmt.get() as { count: number };
     return result.count;
   }
@@ -378,9 +364,7 @@ export class ItemEmailRefRepository {
    * @returns Number of email sources for this item
    */
   static countByItemId(item_id: string): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(
+    const stmt = DatabaseManager.prepare(
       `SELECT COUNT(*) as count FROM ${this.TABLE_NAME} WHERE item_id = ?`
     );
     const result = stmt.get(item_id) as { count: number };
@@ -394,9 +378,7 @@ export class ItemEmailRefRepository {
    * @returns Number of items extracted from this email
    */
   static countByEmailHash(email_hash: string): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(
+    const stmt = DatabaseManager.prepare(
       `SELECT COUNT(*) as count FROM ${this.TABLE_NAME} WHERE email_hash = ?`
     );
     const result = stmt.get(email_hash) as { count: number };
@@ -412,7 +394,11 @@ export class ItemEmailRefRepository {
    * @returns True if item has at least one source reference
    */
   static hasReferences(item_id: string): boolean {
-    return this.countByItemId(item_id) > 0;
+    // Stops at the first matching idx_refs_item entry instead of counting them all
+    const stmt = DatabaseManager.prepare(
+      `SELECT 1 FROM ${this.TABLE_NAME} WHERE item_id = ? LIMIT 1`
+    );
+    return stmt.get(item_id) !== undefined;
   }
 
   /**
@@ -425,13 +411,33 @@ export class ItemEmailRefRepository {
    * @returns Array of created reference IDs
    */
   static batchCreate(refs: Array<{ ref_id: string; data: ItemEmailRefData }>): string[] {
-    return DatabaseManager.transaction(() => {
+    const now = Math.floor(Date.now() / 1000);
+
+    return DatabaseManager.transaction((db) => {
       const created: string[] = [];
 
+      const stmt = db.prepare(`
+        INSERT INTO ${this.TABLE_NAME} (
+          ref_id,
+          item_id,
+          email_hash,
+          evidence_text,
+          confidence,
+          created_at
+        ) VALUES (?, ?, ?, ?, ?, ?)
+      `);
+
       for (const { ref_id, data } of refs) {
         try {
-          const ref = this.create(ref_id, data);
-          created.push(ref.ref_id);
+          stmt.run(
+            ref_id,
+            data.item_id,
+            data.email_hash,
+            data.evidence_text,
+            data.confidence,
+            data.created_at ?? now
+          );
+          created.push(ref_id);
         } catch (error) {
           logger.error('ItemEmailRef', `Failed to create reference in batch: ${ref_id}`, {
             ref_id,
@@ -467,8 +473,14 @@ export class ItemEmailRefRepository {
     avgConfidence: number;
     isValid: boolean;
   } {
-    const refs = this.findByItemId(item_id);
-    const referenceCount = refs.length;
+    // Aggregate in SQL: no reference rows are materialized just to be counted
+    const stmt = DatabaseManager.prepare(`
+      SELECT COUNT(*) as count, AVG(confidence) as avg_confidence
+      FROM ${this.TABLE_NAME}
+      WHERE item_id = ?
+    `);
+    const result = stmt.get(item_id) as { count: number; avg_confidence: number | null };
+    const referenceCount = result.count;
 
     if (referenceCount === 0) {
       return {
@@ -479,13 +491,10 @@ export class ItemEmailRefRepository {
       };
     }
 
-    const totalConfidence = refs.reduce((sum, ref) => sum + ref.confidence, 0);
-    const avgConfidence = totalConfidence / referenceCount;
-
     return {
       hasReferences: true,
       referenceCount,
-      avgConfidence,
+      avgConfidence: result.avg_confidence ?? 0,
       isValid: true, // Has at least one reference
     };
   }
@@ -501,9 +510,7 @@ export class ItemEmailRefRepository {
    * @returns Array of high-confidence references
    */
   static findHighConfidenceReferences(item_id: string, minConfidence: number = 60): ItemEmailRef[] {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`
+    const stmt = DatabaseManager.prepare(`
       SELECT
         ref_id,
         item_id,
@@ -529,9 +536,7 @@ export class ItemEmailRefRepository {
    * @returns Number of deleted references
    */
   static deleteOlderThan(older_than: number): number {
-    const db = DatabaseManager.getDatabase();
-
-    const stmt = db.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE created_at < ?`);
+    const stmt = DatabaseManager.prepare(`DELETE FROM ${this.TABLE_NAME} WHERE created_at < ?`);
     const result = stmt.run(older_than);
 
     logger.info('ItemEmailRef', `Deleted ${result.changes} references older than ${older_than}`, {
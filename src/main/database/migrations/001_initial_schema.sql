@@ -50,6 +50,8 @@ CREATE TABLE IF NOT EXISTS todo_items (
 CREATE INDEX IF NOT EXISTS idx_items_report_date ON todo_items(report_date);
 CREATE INDEX IF NOT EXISTS idx_items_type ON todo_items(item_type);
 CREATE INDEX IF NOT EXISTS idx_items_source_status ON todo_items(source_status);
+-- Partial index: only items with submitted feedback (stats, export, retention cleanup)
+CREATE INDEX IF NOT EXISTS idx_items_feedback_created ON todo_items(created_at) WHERE feedback_type IS NOT NULL;
 
 -- Item-Email references (many-to-many)
 CREATE TABLE IF NOT EXISTS item_email_refs (
@@ -8,20 +8,56 @@ const __dirname = path.dirname(fileURLToPath(import.meta.url));
 /** Initial migration filename used to detect valid migrations dir */
 const INITIAL_MIGRATION = '001_initial_schema.sql';
 
+/** Initial migration path that was last read successfully (skips discovery next time) */
+let resolvedInitialMigration: string | null = null;
+
 /**
- * Resolve migrations directory: prefer src (when running from project root),
+ * Indexes added to the initial migration after it first shipped
+ *
+ * Databases created before these existed never re-run the initial migration,
+ * so they are ensured on every startup (IF NOT EXISTS makes this a no-op).
+ */
+const ADDED_INDEXES = `
+  CREATE INDEX IF NOT EXISTS idx_items_feedback_created ON todo_items(created_at) WHERE feedback_type IS NOT NULL;
+`;
+
+/**
+ * PRAGMA user_version stamped once the version check has passed and
+ * ADDED_INDEXES is in place. Bump it whenever the initial migration or
+ * ADDED_INDEXES changes.
+ */
+const SCHEMA_USER_VERSION = 2;
+
+/**
+ * Read the initial migration: prefer src (when running from project root),
  * fall back to dist (e.g. when packaged).
+ *
+ * Each candidate is read directly rather than stat'ed first, so a hit costs
+ * one open instead of an existence check plus an open.
  */
-function getMigrationsDir(): string {
-  const srcDir = path.join(process.cwd(), 'src', 'main', 'database', 'migrations');
-  if (fs.existsSync(path.join(srcDir, INITIAL_MIGRATION))) {
-    return srcDir;
+function readInitialMigration(): string {
+  const candidates = [
+    path.join(process.cwd(), 'src', 'main', 'database', 'migrations', INITIAL_MIGRATION),
+    path.join(__dirname, 'migrations', INITIAL_MIGRATION),
+  ];
+  if (resolvedInitialMigration) {
+    candidates.unshift(resolvedInitialMigration);
   }
-  const distDir = path.join(__dirname, 'migrations');
-  if (fs.existsSync(path.join(distDir, INITIAL_MIGRATION))) {
-    return distDir;
+
+  for (const candidate of candidates) {
+    try {
+      const sql = fs.readFileSync(candidate, 'utf-8');
+      resolvedInitialMigration = candidate;
+      return sql;
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+        throw error;
+      }
+    }
   }
-  return distDir; // Let runInitialSchema throw with a clear path
+
+  resolvedInitialMigration = null;
+  throw new Error(`Migration file not found: ${candidates[candidates.length - 1]}`);
 }
 
 /**
@@ -34,7 +70,8 @@ function getMigrationsDir(): string {
  * - Resolves migrations from dist (build) or src (dev) automatically
  */
 export class SchemaManager {
-  private static readonly CURRENT_SCHEMA_VERSION = '1.0';
+  /** Schema version written to app_metadata by the initial migration */
+  private static readonly CURRENT_SCHEMA_VERSION = '2.6';
 
   /**
    * Initialize database schema
@@ -44,6 +81,12 @@ export class SchemaManager {
   static async initialize(): Promise<void> {
     const db = DatabaseManager.getDatabase();
 
+    // Already set up by a previous start: skip the catalog lookup, metadata
+    // read and index DDL (user_version lives in the header page)
+    if (db.pragma('user_version', { simple: true }) === SCHEMA_USER_VERSION) {
+      return;
+    }
+
     // Check if app_metadata table exists (created by initial migration)
     const tableExists = db
       .prepare("SELECT name FROM sqlite_master WHERE type='table' AND name='app_metadata'")
@@ -52,33 +95,31 @@ export class SchemaManager {
     if (!tableExists) {
       // First run - execute initial schema (creates app_metadata and all tables)
       await this.runInitialSchema();
-      return;
+    } else {
+      DatabaseManager.exec(ADDED_INDEXES);
     }
 
-    // Schema already exists - check version
+    // Check version
     const schemaVersion = db
       .prepare('SELECT value FROM app_metadata WHERE key = ?')
       .get('schema_version') as { value: string } | undefined;
 
     if (schemaVersion?.value !== this.CURRENT_SCHEMA_VERSION) {
       // Schema version mismatch - would run migrations here
-      // For now, we'll just log a warning
+      // For now, we'll just log a warning. Not stamped, so the check runs
+      // again on the next start instead of being skipped for good.
       console.warn(`Schema version mismatch: expected ${this.CURRENT_SCHEMA_VERSION}, got ${schemaVersion?.value ?? 'unknown'}`);
+      return;
     }
+
+    db.pragma(`user_version = ${SCHEMA_USER_VERSION}`);
   }
 
   /**
    * Run initial schema creation
    */
   private static async runInitialSchema(): Promise<void> {
-    const migrationsDir = getMigrationsDir();
-    const migrationPath = path.join(migrationsDir, INITIAL_MIGRATION);
-
-    if (!fs.existsSync(migrationPath)) {
-      throw new Error(`Migration file not found: ${migrationPath}`);
-    }
-
-    const sql = fs.readFileSync(migrationPath, 'utf-8');
+    const sql = readInitialMigration();
 
     try {
       DatabaseManager.exec(sql);
@@ -243,6 +284,9 @@ export class SchemaManager {
       db.prepare(`DROP INDEX IF EXISTS ${index.name}`).run();
     }
 
+    // Let the next initialize() rebuild the schema instead of taking the fast path
+    db.pragma('user_version = 0');
+
     console.log('Database reset complete');
   }
 }
@@ -19,6 +19,12 @@ import { logger } from '../config/logger.js';
 import { EmailSourceRepository } from '../database/entities/EmailSource.js';
 import type { ParsedEmail } from './parsers/EmailParser.js';
 
+/**
+ * SHA-256 hex digest length and pattern (compiled once at module load)
+ */
+const SHA256_HEX_LENGTH = 64;
+const SHA256_HEX_PATTERN = /^[a-f0-9]{64}$/i;
+
 /**
  * Result of duplicate check
  *
@@ -57,6 +63,9 @@ export interface DuplicateStats {
 
   /** Set of email hashes in current batch for same-batch detection */
   batch_hashes: Set<string>;
+
+  /** Unix timestamp recorded as last_seen_at for every cross-batch duplicate in this batch */
+  seen_at: number;
 }
 
 /**
@@ -134,7 +143,7 @@ export class DuplicateDetector {
         });
 
         // Update last_seen_at timestamp for cross-batch duplicate
-        EmailSourceRepository.updateLastSeen(email_hash);
+        EmailSourceRepository.updateLastSeen(email_hash, stats.seen_at);
 
         stats.cross_batch_count++;
 
@@ -182,13 +191,15 @@ export class DuplicateDetector {
   /**
    * Create fresh duplicate statistics for batch processing
    *
+   * @param seen_at - Unix timestamp shared by the whole batch (defaults to now)
    * @returns New DuplicateStats instance
    */
-  createStats(): DuplicateStats {
+  createStats(seen_at: number = Math.floor(Date.now() / 1000)): DuplicateStats {
     return {
       same_batch_count: 0,
       cross_batch_count: 0,
       batch_hashes: new Set<string>(),
+      seen_at,
     };
   }
 
@@ -237,16 +248,18 @@ export class DuplicateDetector {
    * Returns arrays of duplicate and unique emails.
    *
    * @param emails - Array of parsed emails to check
+   * @param seen_at - Unix timestamp shared by the whole batch (defaults to now)
    * @returns Object with duplicate and unique email arrays, plus stats
    */
   async batchCheckDuplicates(
-    emails: ParsedEmail[]
+    emails: ParsedEmail[],
+    seen_at?: number
   ): Promise<{
     duplicates: Array<{ email: ParsedEmail; result: DuplicateCheckResult }>;
     unique: ParsedEmail[];
     stats: DuplicateStats;
   }> {
-    const stats = this.createStats();
+    const stats = this.createStats(seen_at);
     const duplicates: Array<{ email: ParsedEmail; result: DuplicateCheckResult }> = [];
     const unique: ParsedEmail[] = [];
 
@@ -279,9 +292,8 @@ export class DuplicateDetector {
    * @returns true if hash format is valid
    */
   static isValidEmailHash(email_hash: string): boolean {
-    // SHA-256 hash is 64 hex characters
-    const sha256Regex = /^[a-f0-9]{64}$/i;
-    return sha256Regex.test(email_hash);
+    // SHA-256 hash is 64 hex characters; reject wrong lengths before running the regex
+    return email_hash.length === SHA256_HEX_LENGTH && SHA256_HEX_PATTERN.test(email_hash);
   }
 
   /**
@@ -13,7 +13,8 @@
  * @module main/email/EmailProcessor
  */
 
-import { v4 as uuidv4 } from 'uuid';
+import { randomUUID } from 'crypto';
+import * as os from 'os';
 import { logger } from '../config/logger.js';
 import { DuplicateDetector } from './DuplicateDetector.js';
 import { EmlParser } from './parsers/EmlParser.js';
@@ -22,9 +23,15 @@ import { RuleEngine, type RuleEngineExecutionResult } from '../rules/RuleEngine.
 import type { LLMAdapter, EmailBatch } from '../llm/LLMAdapter.js';
 import { OutputValidator } from '../llm/OutputValidator.js';
 import { ConfidenceCalculator, type ConfidenceResult } from '../llm/ConfidenceCalculator.js';
-import { ActionItemRepository, ItemType, SourceStatus } from '../database/entities/ActionItem.js';
+import {
+  ActionItemRepository,
+  ItemType,
+  SourceStatus,
+  ITEM_TYPE_BY_VALUE,
+  SOURCE_STATUS_BY_VALUE,
+} from '../database/entities/ActionItem.js';
 import { EmailSourceRepository, ExtractStatus } from '../database/entities/EmailSource.js';
-import { ItemEmailRefRepository } from '../database/entities/ItemEmailRef.js';
+import { ItemEmailRefRepository, type ItemEmailRefData } from '../database/entities/ItemEmailRef.js';
 import type { ParsedEmail } from './parsers/EmailParser.js';
 
 /**
@@ -42,8 +49,11 @@ export interface EmailProcessorOptions {
   /** Maximum email body length in characters (default: 100k) */
   maxBodyLength?: number;
 
-  /** Enable detailed logging for debugging */
+  /** Include content previews in per-email/per-item debug logs */
   debug?: boolean;
+
+  /** Maximum number of email files read and parsed concurrently (default: min(8, 2 × CPU count)) */
+  parseConcurrency?: number;
 }
 
 /**
@@ -99,6 +109,9 @@ interface ProcessingContext {
   /** Processing mode (affects confidence calculation) */
   mode: 'local' | 'remote';
 
+  /** Unix timestamp shared by every row written for this batch */
+  batchTimestamp: number;
+
   /** Duplicate detection statistics */
   duplicateStats: ReturnType<DuplicateDetector['createStats']>;
 
@@ -120,8 +133,34 @@ const DEFAULT_OPTIONS: Required<EmailProcessorOptions> = {
   maxBatchSize: 50,
   maxBodyLength: 100000,
   debug: false,
+  parseConcurrency: Math.min(8, os.cpus().length * 2),
 };
 
+/**
+ * Email format for each recognised file extension (without the dot)
+ *
+ * One lookup per file instead of a switch over every extension.
+ */
+const FORMAT_BY_EXTENSION: ReadonlyMap<string, ParsedEmail['format']> = new Map([
+  ['eml', 'eml'],
+  ['msg', 'msg'],
+  ['pst', 'pst'],
+  ['ost', 'ost'],
+  ['mbox', 'mbox'],
+  ['mbx', 'mbox'],
+  ['html', 'html'],
+  ['htm', 'html'],
+]);
+
+/**
+ * Outcome of parsing a single email file
+ *
+ * Either the parsed email or the error that prevented parsing.
+ */
+type ParseOutcome =
+  | { filePath: string; parsed: ParsedEmail; error?: undefined }
+  | { filePath: string; parsed?: undefined; error: string };
+
 /**
  * Email Processor
  *
@@ -244,6 +283,7 @@ export class EmailProcessor {
       const context: ProcessingContext = {
         reportDate,
         mode,
+        batchTimestamp: Math.floor(startTime / 1000),
         duplicateStats: this.duplicateDetector.createStats(),
         parseErrors: [],
         isDegraded: false,
@@ -261,7 +301,8 @@ export class EmailProcessor {
 
       // Step 2: Check duplicates
       const { unique, duplicates, stats } = await this.duplicateDetector.batchCheckDuplicates(
-        parsedEmails
+        parsedEmails,
+        context.batchTimestamp
       );
       context.duplicateStats = stats;
 
@@ -275,12 +316,17 @@ export class EmailProcessor {
       // Step 3: Execute rule engine
       const ruleResults = await this.ruleEngine.executeBatch(unique);
 
+      // Computed once: logged here and reused as the confidence fallback in Step 6
+      // Default to 0 if no rule results (e.g., no emails parsed)
+      const avgRuleScore =
+        ruleResults.length > 0
+          ? ruleResults.reduce((sum: number, r: RuleEngineExecutionResult) => sum + r.score, 0) /
+            ruleResults.length
+          : 0;
+
       logger.info('EmailProcessor', 'Rule engine execution complete', {
         ruleResultsCount: ruleResults.length,
-        avgRuleScore: (
-          ruleResults.reduce((sum: number, r: RuleEngineExecutionResult) => sum + r.score, 0) /
-          ruleResults.length
-        ).toFixed(2),
+        avgRuleScore: avgRuleScore.toFixed(2),
       });
 
       // Step 4: Call LLM adapter
@@ -311,17 +357,13 @@ export class EmailProcessor {
       });
 
       // Step 6: Calculate confidence for each item
-      const confidenceResults = this.calculateConfidenceForBatch(
+      const { results: confidenceResults, avgConfidence } = this.calculateConfidenceForBatch(
         validationResult.output.items,
         ruleResults,
+        avgRuleScore,
         context.isDegraded
       );
 
-      const avgConfidence =
-        confidenceResults.length > 0
-          ? confidenceResults.reduce((sum: number, r: ConfidenceResult) => sum + r.confidence, 0) /
-            confidenceResults.length
-          : 0;
       logger.info('EmailProcessor', 'Confidence calculation complete', {
         itemCount: confidenceResults.length,
         isDegraded: context.isDegraded,
@@ -396,72 +438,110 @@ export class EmailProcessor {
    *
    * Detects email format from file extension and delegates to appropriate parser.
    * Currently only .eml format is supported (T067-T070 will add more parsers).
+   *
+   * Parsing is I/O-bound (file reads + MIME decoding), so files are parsed by a
+   * bounded pool of concurrent workers (options.parseConcurrency). Results are
+   * collected in submission order so downstream stages see the same ordering
+   * as emailFiles.
    */
   private async parseEmails(
     emailFiles: string[]
   ): Promise<{ parsedEmails: ParsedEmail[]; parseErrors: Array<{ email: string; error: string }> }> {
-    const parsedEmails: ParsedEmail[] = [];
-    const parseErrors: Array<{ email: string; error: string }> = [];
+    const outcomes = new Array<ParseOutcome>(emailFiles.length);
+    const workerCount = Math.max(1, Math.min(this.options.parseConcurrency, emailFiles.length));
+    let nextIndex = 0;
+
+    const worker = async (): Promise<void> => {
+      while (nextIndex < emailFiles.length) {
+        const index = nextIndex++;
+        outcomes[index] = await this.parseOne(emailFiles[index]);
+      }
+    };
 
-    for (const filePath of emailFiles) {
-      try {
-        // Detect format from file extension
-        const format = this.detectEmailFormat(filePath);
+    await Promise.all(Array.from({ length: workerCount }, worker));
 
-        if (format !== 'eml') {
-          logger.warn('EmailProcessor', `Unsupported email format: ${format}`, {
-            filePath,
-            format,
-          });
-          parseErrors.push({
-            email: filePath,
-            error: `Unsupported format: ${format} (only .eml supported in MVP)`,
-          });
-          continue;
-        }
+    // Drain results in submission order
+    const parsedEmails: ParsedEmail[] = [];
+    const parseErrors: Array<{ email: string; error: string }> = [];
 
-        // Parse email
-        const parsedEmail = await this.emlParser.parse(filePath);
-
-        // Truncate body if necessary (per FR-057)
-        if (parsedEmail.body && parsedEmail.body.length > this.options.maxBodyLength) {
-          const originalLength = parsedEmail.body.length;
-          parsedEmail.body = parsedEmail.body.substring(0, this.options.maxBodyLength);
-          logger.debug('EmailProcessor', 'Email body truncated', {
-            filePath,
-            originalLength,
-            truncatedLength: this.options.maxBodyLength,
-          });
-        }
+    for (const outcome of outcomes) {
+      if (outcome.parsed) {
+        parsedEmails.push(outcome.parsed);
+      } else {
+        parseErrors.push({ email: outcome.filePath, error: outcome.error });
+      }
+    }
 
-        // Generate search string for traceability
-        const traceabilityInfo = this.traceabilityGenerator.generateTraceability(parsedEmail);
-        parsedEmail.search_string = traceabilityInfo.search_string;
-        parsedEmail.file_path = filePath;
+    return { parsedEmails, parseErrors };
+  }
 
-        parsedEmails.push(parsedEmail);
+  /**
+   * Parse a single email file
+   *
+   * @param filePath - Email file path
+   * @returns Promise resolving to the parse outcome (never rejects)
+   *
+   * Has no side effects beyond logging, so it is safe to run concurrently.
+   */
+  private async parseOne(filePath: string): Promise<ParseOutcome> {
+    try {
+      // Detect format from file extension
+      const format = this.detectEmailFormat(filePath);
 
-        logger.debug('EmailProcessor', 'Email parsed successfully', {
+      if (format !== 'eml') {
+        logger.warn('EmailProcessor', `Unsupported email format: ${format}`, {
           filePath,
-          emailHash: parsedEmail.email_hash.substring(0, 16) + '...',
-          message_id: parsedEmail.message_id,
-          from: parsedEmail.from,
-          subject: parsedEmail.subject.substring(0, 50),
+          format,
         });
-      } catch (error) {
-        const errorMessage = error instanceof Error ? error.message : String(error);
-        logger.error('EmailProcessor', 'Failed to parse email', {
+        return {
           filePath,
-          error: errorMessage,
-        });
-        parseErrors.push({
-          email: filePath,
-          error: errorMessage,
+          error: `Unsupported format: ${format} (only .eml supported in MVP)`,
+        };
+      }
+
+      // Parse email
+      const parsedEmail = await this.emlParser.parse(filePath);
+
+      // Truncate body if necessary (per FR-057)
+      if (parsedEmail.body && parsedEmail.body.length > this.options.maxBodyLength) {
+        const originalLength = parsedEmail.body.length;
+        parsedEmail.body = parsedEmail.body.substring(0, this.options.maxBodyLength);
+        logger.debug('EmailProcessor', 'Email body truncated', {
+          filePath,
+          originalLength,
+          truncatedLength: this.options.maxBodyLength,
         });
       }
-    }
 
-    return { parsedEmails, parseErrors };
+      // Generate search string for traceability
+      const traceabilityInfo = this.traceabilityGenerator.generateTraceability(parsedEmail);
+      parsedEmail.search_string = traceabilityInfo.search_string;
+      parsedEmail.file_path = filePath;
+
+      // Header previews are only built when debug detail was requested
+      logger.debug(
+        'EmailProcessor',
+        'Email parsed successfully',
+        this.options.debug
+          ? {
+              filePath,
+              emailHash: parsedEmail.email_hash.substring(0, 16) + '...',
+              message_id: parsedEmail.message_id,
+              from: parsedEmail.from,
+              subject: parsedEmail.subject.substring(0, 50),
+            }
+          : { filePath }
+      );
+
+      return { filePath, parsed: parsedEmail };
+    } catch (error) {
+      const errorMessage = error instanceof Error ? error.message : String(error);
+      logger.error('EmailProcessor', 'Failed to parse email', {
+        filePath,
+        error: errorMessage,
+      });
+      return { filePath, error: errorMessage };
+    }
   }
 
   /**
@@ -472,27 +552,11 @@ export class EmailProcessor {
    *
    * TODO: T075 will implement format detection logic with file extension validation
    */
-  private detectEmailFormat(filePath: string): 'eml' | 'msg' | 'pst' | 'ost' | 'mbox' | 'html' {
-    const extension = filePath.split('.').pop()?.toLowerCase();
-
-    switch (extension) {
-      case 'eml':
-        return 'eml';
-      case 'msg':
-        return 'msg';
-      case 'pst':
-      case 'ost':
-        return extension;
-      case 'mbox':
-      case 'mbx':
-        return 'mbox';
-      case 'html':
-      case 'htm':
-        return 'html';
-      default:
-        // Default to eml for MVP
-        return 'eml';
-    }
+  private detectEmailFormat(filePath: string): ParsedEmail['format'] {
+    const extension = filePath.split('.').pop()?.toLowerCase() ?? '';
+
+    // Default to eml for MVP
+    return FORMAT_BY_EXTENSION.get(extension) ?? 'eml';
   }
 
   /**
@@ -501,8 +565,9 @@ export class EmailProcessor {
    * @param llmItems - Items extracted by LLM
    * @param uniqueEmails - Unique non-duplicate emails
    * @param ruleResults - Rule engine execution results
+   * @param avgRuleScore - Mean rule score of the batch (fallback for unattributed items)
    * @param isDegraded - Whether schema validation failed (triggers degraded mode)
-   * @returns Array of confidence calculation results
+   * @returns Confidence calculation results plus their mean, computed in the same pass
    *
    * Per FR-010: Schema failure adjustment (rules 60% + LLM 20%, capped at 0.6)
    *
@@ -512,53 +577,48 @@ export class EmailProcessor {
   private calculateConfidenceForBatch(
     llmItems: Array<{ content: string; type: 'completed' | 'pending'; source_email_indices?: number[]; evidence: string; confidence: number; source_status: 'verified' | 'unverified' }>,
     ruleResults: Array<{ score: number; rulesTriggered: number; details: { hasDeadlineKeyword: boolean; hasPriorityKeyword: boolean; isWhitelistedSender: boolean; actionVerbCount: number } }>,
+    avgRuleScore: number,
     isDegraded: boolean
-  ): Array<{ confidence: number; ruleContribution: number; llmContribution: number; isDegraded: boolean; details: { ruleScore: number; llmScore: number; ruleWeight: number; llmWeight: number; capApplied: boolean } }> {
-    // Calculate average rule score for fallback
-    // Default to 0 if no rule results (e.g., no emails parsed)
-    const avgRuleScore =
-      ruleResults.length > 0
-        ? ruleResults.reduce((sum: number, r) => sum + r.score, 0) / ruleResults.length
-        : 0;
-
-    return llmItems.map((llmItem) => {
+  ): { results: ConfidenceResult[]; avgConfidence: number } {
+    // Shared per batch: fallback rule result for items without a usable source
+    // email, and the calculation options (identical for every item)
+    const fallbackRuleResult = {
+      score: avgRuleScore,
+      rulesTriggered: 0,
+      details: {
+        hasDeadlineKeyword: false,
+        hasPriorityKeyword: false,
+        isWhitelistedSender: false,
+        actionVerbCount: 0,
+      },
+    };
+    const calculationOptions = {
+      isDegraded,
+      // FR-010: Schema failure adjustment (rules 60% + LLM 20%, capped at 0.6)
+      maxConfidence: isDegraded ? 0.6 : 1.0,
+    };
+
+    // Single pass: score each item and accumulate the batch average alongside
+    const results: ConfidenceResult[] = [];
+    let confidenceSum = 0;
+
+    for (const llmItem of llmItems) {
       // Map LLM item to rule result based on source_email_indices
-      let ruleResult;
-
-      if (llmItem.source_email_indices && llmItem.source_email_indices.length > 0) {
-        // Use rule result from first source email
-        const firstEmailIndex = llmItem.source_email_indices[0];
-        ruleResult = ruleResults[firstEmailIndex] || {
-          score: avgRuleScore,
-          rulesTriggered: 0,
-          details: {
-            hasDeadlineKeyword: false,
-            hasPriorityKeyword: false,
-            isWhitelistedSender: false,
-            actionVerbCount: 0,
-          },
-        };
-      } else {
-        // No source attribution, use average rule score (degraded)
-        ruleResult = {
-          score: avgRuleScore,
-          rulesTriggered: 0,
-          details: {
-            hasDeadlineKeyword: false,
-            hasPriorityKeyword: false,
-            isWhitelistedSender: false,
-            actionVerbCount: 0,
-          },
-        };
-      }
+      // (use rule result from first source email; no source attribution → average, degraded)
+      const firstEmailIndex = llmItem.source_email_indices?.[0];
+      const ruleResult =
+        (firstEmailIndex !== undefined && ruleResults[firstEmailIndex]) || fallbackRuleResult;
 
       // Calculate confidence using dual-engine formula
-      return ConfidenceCalculator.calculate(ruleResult, llmItem, {
-        isDegraded,
-        // FR-010: Schema failure adjustment (rules 60% + LLM 20%, capped at 0.6)
-        maxConfidence: isDegraded ? 0.6 : 1.0,
-      });
-    });
+      const result = ConfidenceCalculator.calculate(ruleResult, llmItem, calculationOptions);
+      results.push(result);
+      confidenceSum += result.confidence;
+    }
+
+    return {
+      results,
+      avgConfidence: results.length > 0 ? confidenceSum / results.length : 0,
+    };
   }
 
   /**
@@ -593,87 +653,107 @@ export class EmailProcessor {
       evidence: string;
     }> = [];
 
+    // Collect rows in memory and flush each table in one transaction
+    // (one commit per table instead of one per row)
+    const now = context.batchTimestamp;
+
     // Store email sources
-    for (const email of uniqueEmails) {
-      try {
-        EmailSourceRepository.create(email.email_hash, {
-          processed_at: Math.floor(Date.now() / 1000),
-          last_seen_at: Math.floor(Date.now() / 1000),
+    EmailSourceRepository.batchCreate(
+      uniqueEmails.map((email) => ({
+        email_hash: email.email_hash,
+        data: {
+          processed_at: now,
+          last_seen_at: now,
           report_date: context.reportDate,
           attachments_meta: JSON.stringify(email.attachments || []),
           extract_status: ExtractStatus.SUCCESS,
           search_string: email.search_string || '',
           file_path: email.file_path || '',
-        });
-      } catch {
-        // Email source might already exist (cross-batch duplicate)
-        logger.debug('EmailProcessor', 'Email source already exists, skipping', {
-          emailHash: email.email_hash.substring(0, 16) + '...',
-        });
-      }
-    }
+        },
+      }))
+    );
+
+    // Store action items
+    // source_status is taken as-is: OutputValidator already marks every item
+    // 'unverified' when it degrades the output, so no per-item override is needed
+    const pendingItems = llmItems.map((llmItem, i) => ({
+      item_id: randomUUID(),
+      llmItem,
+      confidenceResult: confidenceResults[i],
+      source_status: llmItem.source_status,
+    }));
+
+    const createdIds = new Set(
+      await ActionItemRepository.batchCreate(
+        pendingItems.map(({ item_id, llmItem, confidenceResult, source_status }) => ({
+          item_id,
+          data: {
+            report_date: context.reportDate,
+            content: llmItem.content,
+            // Unknown values degrade like OutputValidator does rather than storing undefined
+            item_type: ITEM_TYPE_BY_VALUE[llmItem.type] ?? ItemType.PENDING,
+            source_status: SOURCE_STATUS_BY_VALUE[source_status] ?? SourceStatus.UNVERIFIED,
+            confidence_score: confidenceResult.confidence,
+            tags: [],
+            created_at: now,
+            is_manually_edited: false,
+          },
+        }))
+      )
+    );
 
-    // Store action items with email references
-    for (let i = 0; i < llmItems.length; i++) {
-      const llmItem = llmItems[i];
-      const confidenceResult = confidenceResults[i];
+    // Store email references for items that were created
+    const refs: Array<{ ref_id: string; data: ItemEmailRefData }> = [];
 
-      const item_id = uuidv4();
+    for (const { item_id, llmItem, confidenceResult, source_status } of pendingItems) {
+      if (!createdIds.has(item_id)) {
+        continue;
+      }
 
-      try {
-        // Create action item
-        await ActionItemRepository.create(item_id, {
-          report_date: context.reportDate,
-          content: llmItem.content,
-          item_type: llmItem.type === 'completed' ? ItemType.COMPLETED : ItemType.PENDING,
-          source_status: context.isDegraded ? SourceStatus.UNVERIFIED : (llmItem.source_status === 'verified' ? SourceStatus.VERIFIED : SourceStatus.UNVERIFIED),
-          confidence_score: confidenceResult.confidence,
-          tags: [],
-          created_at: Math.floor(Date.now() / 1000),
-          is_manually_edited: false,
-        });
+      // Create email references if source_email_indices provided
+      for (const emailIndex of llmItem.source_email_indices ?? []) {
+        const email = uniqueEmails[emailIndex];
+
+        if (email) {
+          refs.push({
+            ref_id: randomUUID(),
+            data: {
+              item_id,
+              email_hash: email.email_hash,
+              evidence_text: llmItem.evidence || '',
+              confidence: Math.round(confidenceResult.confidence * 100),
+              created_at: now,
+            },
+          });
+        }
+      }
 
-        // Create email references if source_email_indices provided
-        if (llmItem.source_email_indices && llmItem.source_email_indices.length > 0) {
-          for (let j = 0; j < llmItem.source_email_indices.length; j++) {
-            const emailIndex = llmItem.source_email_indices[j];
-            const email = uniqueEmails[emailIndex];
-
-            if (email) {
-              const ref_id = uuidv4();
-              ItemEmailRefRepository.create(ref_id, {
-                item_id,
-                email_hash: email.email_hash,
-                evidence_text: llmItem.evidence || '',
-                confidence: Math.round(confidenceResult.confidence * 100),
-              });
+      storedItems.push({
+        item_id,
+        content: llmItem.content,
+        item_type: llmItem.type,
+        confidence: confidenceResult.confidence,
+        source_status,
+        evidence: llmItem.evidence,
+      });
+
+      logger.debug(
+        'EmailProcessor',
+        'Action item stored',
+        this.options.debug
+          ? {
+              item_id,
+              contentPreview: llmItem.content.substring(0, 50),
+              confidence: confidenceResult.confidence,
+              source_status,
+              isDegraded: context.isDegraded,
             }
-          }
-        }
+          : { item_id, source_status }
+      );
+    }
 
-        storedItems.push({
-          item_id,
-          content: llmItem.content,
-          item_type: llmItem.type,
-          confidence: confidenceResult.confidence,
-          source_status: context.isDegraded ? 'unverified' : llmItem.source_status,
-          evidence: llmItem.evidence,
-        } as any);
-
-        logger.debug('EmailProcessor', 'Action item stored', {
-          item_id,
-          contentPreview: llmItem.content.substring(0, 50),
-          confidence: confidenceResult.confidence,
-          source_status: context.isDegraded ? 'unverified' : llmItem.source_status,
-          isDegraded: context.isDegraded,
-        });
-      } catch (error) {
-        logger.error('EmailProcessor', 'Failed to store action item', {
-          item_id,
-          error: error instanceof Error ? error.message : String(error),
-        });
-        // Continue with next item (partial failure handling)
-      }
+    if (refs.length > 0) {
+      ItemEmailRefRepository.batchCreate(refs);
     }
 
     return storedItems;
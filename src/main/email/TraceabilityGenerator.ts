@@ -50,7 +50,7 @@ export class TraceabilityGenerator {
   private static readonly MAX_SUBJECT_LENGTH = 30;
 
   /**
-   * Subject prefixes to strip (reply/forward indicators)
+   * Subject prefixes to strip (reply/forward indicators), lowercase
    */
   private static readonly SUBJECT_PREFIXES = [
     're:',
@@ -61,6 +61,14 @@ export class TraceabilityGenerator {
     '答案:',
   ];
 
+  /**
+   * Length of the longest subject prefix; only this many leading characters
+   * need lowercasing to test for a prefix
+   */
+  private static readonly MAX_PREFIX_LENGTH = Math.max(
+    ...TraceabilityGenerator.SUBJECT_PREFIXES.map((prefix) => prefix.length)
+  );
+
   /**
    * Generate traceability information for parsed email
    *
@@ -111,26 +119,17 @@ export class TraceabilityGenerator {
    * @returns Formatted search string
    */
   private generateSearchString(parsed: ParsedEmail): string {
-    const parts: string[] = [];
-
-    // Add sender: from:email@domain.com
-    parts.push(`from:${parsed.from}`);
+    const dateOnly = this.extractDateOnly(parsed.date);
 
     // Add subject snippet (truncated, cleaned)
     const subjectSnippet = this.cleanAndTruncateSubject(parsed.subject);
-    if (subjectSnippet) {
-      // Quote multi-word subjects
-      const quotedSubject = subjectSnippet.includes(' ')
-        ? `"${subjectSnippet}"`
-        : subjectSnippet;
-      parts.push(`subject:${quotedSubject}`);
+    if (!subjectSnippet) {
+      return `from:${parsed.from} date:${dateOnly}`;
     }
 
-    // Add date: YYYY-MM-DD
-    const dateOnly = this.extractDateOnly(parsed.date);
-    parts.push(`date:${dateOnly}`);
-
-    return parts.join(' ');
+    // Quote multi-word subjects
+    const quotedSubject = subjectSnippet.includes(' ') ? `"${subjectSnippet}"` : subjectSnippet;
+    return `from:${parsed.from} subject:${quotedSubject} date:${dateOnly}`;
   }
 
   /**
@@ -142,16 +141,20 @@ export class TraceabilityGenerator {
    * @returns Cleaned and truncated subject
    */
   private cleanAndTruncateSubject(subject: string): string {
-    if (!subject || subject.trim().length === 0) {
+    let cleaned = subject ? subject.trim() : '';
+    if (cleaned.length === 0) {
       return '';
     }
 
-    let cleaned = subject.trim();
-
-    // Strip common prefixes (case-insensitive)
+    // Strip common prefixes (case-insensitive; SUBJECT_PREFIXES are already lowercase).
+    // Only the leading characters that a prefix could cover are lowercased,
+    // and only again after a prefix is actually stripped.
+    const headLength = TraceabilityGenerator.MAX_PREFIX_LENGTH;
+    let lowered = cleaned.slice(0, headLength).toLowerCase();
     for (const prefix of TraceabilityGenerator.SUBJECT_PREFIXES) {
-      if (cleaned.toLowerCase().startsWith(prefix.toLowerCase())) {
+      if (lowered.startsWith(prefix)) {
         cleaned = cleaned.substring(prefix.length).trim();
+        lowered = cleaned.slice(0, headLength).toLowerCase();
       }
     }
 
@@ -14,6 +14,7 @@ import { promises as fs } from 'fs';
 import * as path from 'path';
 import { logger } from '../../config/logger.js';
 import type { EmailParser, ParsedEmail } from './EmailParser.js';
+import { normalizeMessageId } from './messageId.js';
 import { formatISO8601 } from '../../../shared/utils/dateUtils.js';
 
 /**
@@ -112,7 +113,7 @@ export class EmlParser implements EmailParser {
     // mailparser provides messageId property
     if (parsed.messageId) {
       // Clean up Message-ID (remove angle brackets if present)
-      return parsed.messageId.replace(/^<|>$/g, '');
+      return normalizeMessageId(parsed.messageId);
     }
 
     logger.debug('EmlParser', 'Message-ID not found in email headers');
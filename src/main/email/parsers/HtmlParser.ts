@@ -11,14 +11,42 @@
  * @module main/email/parsers/HtmlParser
  */
 
-import * as cheerio from 'cheerio';
+import type * as cheerio from 'cheerio';
 import { createHash } from 'crypto';
 import { promises as fs } from 'fs';
 import * as path from 'path';
 import { logger } from '../../config/logger.js';
 import type { EmailParser, ParsedEmail } from './EmailParser.js';
+import { parseSenderAddress } from './address.js';
+import { normalizeMessageId } from './messageId.js';
 import { formatISO8601 } from '../../../shared/utils/dateUtils.js';
 
+/**
+ * Patterns for metadata exported as plain text in the document body
+ * (compiled once at module load)
+ */
+const BODY_MESSAGE_ID_PATTERN = /Message-ID:\s*<([^>]+)>/i;
+const BODY_FROM_PATTERN = /From:\s*<?([^>\s@]+@[^>\s]+)>?/i;
+
+/**
+ * Pending cheerio import, shared by every parse call
+ */
+let cheerioModule: Promise<typeof cheerio> | undefined;
+
+/**
+ * Load cheerio on first use and reuse the module afterwards
+ *
+ * Keeps cheerio out of startup while avoiding a dynamic import per file.
+ * A failed import is not cached so the next parse can retry it.
+ */
+function loadCheerio(): Promise<typeof cheerio> {
+  cheerioModule ??= import('cheerio').catch((error: unknown) => {
+    cheerioModule = undefined;
+    throw error;
+  });
+  return cheerioModule;
+}
+
 /**
  * HtmlParser implements EmailParser interface for .htm/.html files
  *
@@ -45,13 +73,18 @@ export class HtmlParser implements EmailParser {
       // Read HTML content
       const html = await fs.readFile(filePath, 'utf-8');
 
-      // Parse with cheerio
-      const $ = cheerio.load(html);
+      // Parse with cheerio (imported on first use, then reused)
+      const { load } = await loadCheerio();
+      const $ = load(html);
+
+      // $('body').text() walks the whole document; compute it at most once per file
+      let bodyText: string | undefined;
+      const getBodyText = (): string => (bodyText ??= $('body').text());
 
       // Extract metadata from <meta> tags and content
-      const messageId = this.extractMessageId($, html);
-      const from = this.extractSenderEmail($, html);
-      const date = this.extractDate($, html);
+      const messageId = this.extractMessageId($, getBodyText);
+      const from = this.extractSenderEmail($, getBodyText);
+      const date = this.extractDate($, getBodyText);
       const subject = this.extractSubject($, html);
 
       // Compute SHA-256 fingerprint per R0-4
@@ -61,7 +94,7 @@ export class HtmlParser implements EmailParser {
       const attachments = this.extractAttachments($, html);
 
       // Extract body (main content)
-      const body = this.extractBody($, html);
+      const body = this.extractBody($, getBodyText);
 
       logger.debug('HtmlParser', `Successfully parsed HTML email: ${messageId || '(no Message-ID)'}`);
 
@@ -103,10 +136,13 @@ export class HtmlParser implements EmailParser {
    * Looks for <meta name="message-id"> or similar tags.
    *
    * @param $ - Cheerio instance (Root type from cheerio.load())
-   * @param html - Original HTML content
+   * @param getBodyText - Returns the document body text (computed once per file)
    * @returns Message-ID string or undefined if missing
    */
-  private extractMessageId($: ReturnType<typeof cheerio.load>, _html: string): string | undefined {
+  private extractMessageId(
+    $: ReturnType<typeof cheerio.load>,
+    getBodyText: () => string
+  ): string | undefined {
     // Try various meta tag patterns
     const metaSelectors = [
       'meta[name="message-id"]',
@@ -119,13 +155,17 @@ export class HtmlParser implements EmailParser {
       const value = $(selector).attr('content');
       if (value) {
         // Clean up Message-ID (remove angle brackets if present)
-        return value.replace(/^<|>$/g, '');
+        return normalizeMessageId(value);
       }
     }
 
     // Try to find Message-ID in document body (sometimes exported as text)
-    const bodyText = $('body').text();
-    const messageMatch = bodyText.match(/Message-ID:\s*<([^>]+)>/i);
+    // A match needs both angle brackets; skip the regex scan when either is absent
+    const bodyText = getBodyText();
+    const messageMatch =
+      bodyText.includes('<') && bodyText.includes('>')
+        ? bodyText.match(BODY_MESSAGE_ID_PATTERN)
+        : null;
     if (messageMatch) {
       return messageMatch[1];
     }
@@ -163,10 +203,10 @@ export class HtmlParser implements EmailParser {
    * Looks for <meta name="from"> or similar tags.
    *
    * @param $ - Cheerio instance (Root type from cheerio.load())
-   * @param html - Original HTML content
+   * @param getBodyText - Returns the document body text (computed once per file)
    * @returns Sender email address
    */
-  private extractSenderEmail($: ReturnType<typeof cheerio.load>, _html: string): string {
+  private extractSenderEmail($: ReturnType<typeof cheerio.load>, getBodyText: () => string): string {
     // Try meta tags first
     const metaSelectors = [
       'meta[name="from"]',
@@ -178,19 +218,17 @@ export class HtmlParser implements EmailParser {
       const value = $(selector).attr('content');
       if (value) {
         // Extract email from value
-        const emailMatch = value.match(/<([^>]+)>/);
-        if (emailMatch) {
-          return emailMatch[1];
-        }
-        if (value.includes('@')) {
-          return value;
+        const address = parseSenderAddress(value);
+        if (address) {
+          return address;
         }
       }
     }
 
     // Try to find in document body (common pattern: "From: sender@example.com")
-    const bodyText = $('body').text();
-    const fromMatch = bodyText.match(/From:\s*<?([^>\s@]+@[^>\s]+)>?/i);
+    // A match needs an '@'; skip the regex scan when there is none
+    const bodyText = getBodyText();
+    const fromMatch = bodyText.includes('@') ? bodyText.match(BODY_FROM_PATTERN) : null;
     if (fromMatch) {
       return fromMatch[1];
     }
@@ -243,10 +281,10 @@ export class HtmlParser implements EmailParser {
    * Uses date-fns formatISO8601 per plan.md R0-9.
    *
    * @param $ - Cheerio instance (Root type from cheerio.load())
-   * @param html - Original HTML content
+   * @param getBodyText - Returns the document body text (computed once per file)
    * @returns ISO 8601 date string
    */
-  private extractDate($: ReturnType<typeof cheerio.load>, _html: string): string {
+  private extractDate($: ReturnType<typeof cheerio.load>, getBodyText: () => string): string {
     // Try meta tags
     const metaSelectors = [
       'meta[name="date"]',
@@ -269,7 +307,7 @@ export class HtmlParser implements EmailParser {
     }
 
     // Try to find in document body
-    const bodyText = $('body').text();
+    const bodyText = getBodyText();
     const dateMatch = bodyText.match(/Date:\s*([^\n]+)/i);
     if (dateMatch) {
       try {
@@ -336,10 +374,13 @@ export class HtmlParser implements EmailParser {
    * Returns undefined if body is too short (<200 chars) per FR-013.
    *
    * @param $ - Cheerio instance (Root type from cheerio.load())
-   * @param _html - Original HTML content (unused but kept for interface consistency)
+   * @param getBodyText - Returns the document body text (computed once per file)
    * @returns Truncated body content or undefined
    */
-  private extractBody($: ReturnType<typeof cheerio.load>, _html: string): string | undefined {
+  private extractBody(
+    $: ReturnType<typeof cheerio.load>,
+    getBodyText: () => string
+  ): string | undefined {
     // Try to find main content area
     let body = '';
 
@@ -358,7 +399,7 @@ export class HtmlParser implements EmailParser {
       const element = $(selector);
       if (element.length > 0) {
         // Get text content
-        body = element.text().trim();
+        body = (selector === 'body' ? getBodyText() : element.text()).trim();
         if (body.length > 200) {
           break; // Found substantial content
         }
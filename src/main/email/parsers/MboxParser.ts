@@ -15,6 +15,8 @@ import { promises as fs } from 'fs';
 import * as path from 'path';
 import { logger } from '../../config/logger.js';
 import type { EmailParser, ParsedEmail } from './EmailParser.js';
+import { parseSenderAddress } from './address.js';
+import { normalizeMessageId } from './messageId.js';
 import { formatISO8601 } from '../../../shared/utils/dateUtils.js';
 
 /**
@@ -32,6 +34,22 @@ export class MboxParser implements EmailParser {
    */
   private static readonly MAX_BODY_SIZE = 100000;
 
+  /**
+   * Maximum number of mbox files whose first email is kept in memory
+   */
+  private static readonly MAX_CACHED_FILES = 32;
+
+  /**
+   * First email of recently parsed mbox files, keyed by path
+   *
+   * An entry is reused only while the file's size and mtime are unchanged,
+   * so re-parsing an unmodified mailbox needs a stat but no read or scan.
+   */
+  private static parsedCache = new Map<
+    string,
+    { size: number; mtimeMs: number; email: ParsedEmail }
+  >();
+
   /**
    * Parse .mbox file and extract metadata
    *
@@ -46,24 +64,31 @@ export class MboxParser implements EmailParser {
     try {
       logger.debug('MboxParser', `Starting parse for file: ${filePath}`);
 
+      const stats = await fs.stat(filePath);
+      const cached = MboxParser.parsedCache.get(filePath);
+      if (cached && cached.size === stats.size && cached.mtimeMs === stats.mtimeMs) {
+        logger.debug('MboxParser', `Reusing first email for unchanged file: ${filePath}`);
+        return MboxParser.copyParsedEmail(cached.email);
+      }
+
       // Read entire mbox file
       const content = await fs.readFile(filePath, 'utf-8');
 
-      // Split into individual emails using From_ delimiter
-      const emails = this.splitMbox(content);
+      // Locate only the first email; later messages are never split or joined
+      const firstContent = this.extractFirstEmail(content);
 
-      if (emails.length === 0) {
+      if (firstContent === undefined) {
         throw new Error('No emails found in mbox file');
       }
 
-      logger.debug('MboxParser', `Found ${emails.length} emails in mbox file`);
-
       // Parse first email
-      const firstEmail = this.parseEmailContent(emails[0], filePath);
+      const firstEmail = this.parseEmailContent(firstContent, filePath);
 
       logger.debug('MboxParser', `Successfully parsed first email: ${firstEmail.message_id || '(no Message-ID)'}`);
 
-      return firstEmail;
+      MboxParser.cacheParsedEmail(filePath, stats.size, stats.mtimeMs, firstEmail);
+
+      return MboxParser.copyParsedEmail(firstEmail);
     } catch (error) {
       const errorMessage = error instanceof Error ? error.message : String(error);
       logger.error('MboxParser', 'Failed to parse .mbox file', error, { filePath });
@@ -72,6 +97,32 @@ export class MboxParser implements EmailParser {
     }
   }
 
+  /**
+   * Remember the first email of a file, evicting the oldest entry when full
+   */
+  private static cacheParsedEmail(
+    filePath: string,
+    size: number,
+    mtimeMs: number,
+    email: ParsedEmail
+  ): void {
+    this.parsedCache.delete(filePath);
+    if (this.parsedCache.size >= this.MAX_CACHED_FILES) {
+      const oldest = this.parsedCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.parsedCache.delete(oldest);
+      }
+    }
+    this.parsedCache.set(filePath, { size, mtimeMs, email });
+  }
+
+  /**
+   * Copy a cached ParsedEmail so callers can mutate it (e.g. body truncation)
+   */
+  private static copyParsedEmail(email: ParsedEmail): ParsedEmail {
+    return { ...email, attachments: email.attachments.map((a) => ({ ...a })) };
+  }
+
   /**
    * Check if file can be parsed as .mbox
    *
@@ -83,44 +134,56 @@ export class MboxParser implements EmailParser {
   }
 
   /**
-   * Split mbox content into individual emails
+   * Extract the first email from mbox content
    *
-   * Uses From_ delimiter (lines starting with "From ").
-   * Records file offsets for each email.
+   * Uses From_ delimiter (lines starting with "From "). Scans with indexOf
+   * from delimiter to delimiter and slices out only the first non-empty
+   * email, instead of splitting the whole file into lines.
    *
    * @param content - Raw mbox file content
-   * @returns Array of email contents
+   * @returns Content of the first email (without its From_ line), or undefined if none
    */
-  private splitMbox(content: string): string[] {
-    const emails: string[] = [];
-    const lines = content.split('\n');
-    let currentEmail: string[] = [];
-    let inEmail = false;
-
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
-
-      // Check for From_ delimiter (line starts with "From ")
-      if (line.startsWith('From ')) {
-        // Save previous email if exists
-        if (inEmail && currentEmail.length > 0) {
-          emails.push(currentEmail.join('\n'));
-        }
-        // Start new email
-        currentEmail = [];
-        inEmail = true;
-      } else if (inEmail) {
-        // Add line to current email
-        currentEmail.push(line);
+  private extractFirstEmail(content: string): string | undefined {
+    let delimiter = this.findDelimiter(content, 0);
+
+    while (delimiter !== -1) {
+      const lineEnd = content.indexOf('\n', delimiter);
+      if (lineEnd === -1) {
+        // From_ line is the last line: no email content follows
+        return undefined;
       }
-    }
 
-    // Don't forget the last email
-    if (inEmail && currentEmail.length > 0) {
-      emails.push(currentEmail.join('\n'));
+      const emailStart = lineEnd + 1;
+      const next = this.findDelimiter(content, emailStart);
+
+      if (next === -1) {
+        return content.slice(emailStart);
+      }
+      if (next > emailStart) {
+        // Drop the newline that terminates the last line before the next From_
+        return content.slice(emailStart, next - 1);
+      }
+
+      // Empty email (From_ immediately followed by another From_): skip it
+      delimiter = next;
     }
 
-    return emails;
+    return undefined;
+  }
+
+  /**
+   * Find the start of the next line beginning with "From " at or after from
+   *
+   * @param content - Raw mbox file content
+   * @param from - Offset at which a line starts
+   * @returns Offset of the delimiter line, or -1 if there is none
+   */
+  private findDelimiter(content: string, from: number): number {
+    if (content.startsWith('From ', from)) {
+      return from;
+    }
+    const index = content.indexOf('\nFrom ', from);
+    return index === -1 ? -1 : index + 1;
   }
 
   /**
@@ -169,39 +232,64 @@ export class MboxParser implements EmailParser {
   /**
    * Split email content into headers and body
    *
+   * Scans header lines with indexOf instead of splitting the whole email into
+   * lines and running a regex per line; the body is sliced out once rather
+   * than re-joined line by line.
+   *
    * @param emailContent - Raw email content
    * @returns Headers object and body string
    */
   private splitHeadersAndBody(emailContent: string): { headers: Record<string, string>; body: string } {
-    const lines = emailContent.split('\n');
     const headers: Record<string, string> = {};
-    let headerEndIndex = 0;
+    let bodyStart = -1;
+    let lineStart = 0;
 
     // Extract headers (until empty line)
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
+    for (;;) {
+      const newline = emailContent.indexOf('\n', lineStart);
+      const lineEnd = newline === -1 ? emailContent.length : newline;
+      const line = emailContent.slice(lineStart, lineEnd);
+
       if (line.trim() === '') {
-        headerEndIndex = i;
+        bodyStart = newline === -1 ? emailContent.length : newline + 1;
         break;
       }
 
-      // Parse header line
-      const match = line.match(/^([^:]+):\s*(.*)$/);
-      if (match) {
-        const headerName = match[1].toLowerCase();
-        const headerValue = match[2];
-
-        // Handle continuation lines (start with whitespace)
-        if (headers[headerName]) {
-          headers[headerName] += ' ' + headerValue;
-        } else {
-          headers[headerName] = headerValue;
+      // Parse header line ("Name: value"). As with the previous
+      // /^([^:]+):\s*(.*)$/ match, values containing a line terminator are skipped.
+      const colon = line.indexOf(':');
+      if (colon > 0) {
+        const headerValue = line.slice(colon + 1).trimStart();
+        if (
+          !headerValue.includes('\r') &&
+          !headerValue.includes('\u2028') &&
+          !headerValue.includes('\u2029')
+        ) {
+          const headerName = line.slice(0, colon).toLowerCase();
+
+          // Handle continuation lines (start with whitespace)
+          if (headers[headerName]) {
+            headers[headerName] += ' ' + headerValue;
+          } else {
+            headers[headerName] = headerValue;
+          }
         }
       }
+
+      if (newline === -1) {
+        break;
+      }
+      lineStart = newline + 1;
+    }
+
+    // No blank line: everything after the first line is treated as body
+    if (bodyStart === -1) {
+      const firstNewline = emailContent.indexOf('\n');
+      bodyStart = firstNewline === -1 ? emailContent.length : firstNewline + 1;
     }
 
     // Extract body (everything after headers)
-    const body = lines.slice(headerEndIndex + 1).join('\n');
+    const body = emailContent.slice(bodyStart);
 
     return { headers, body };
   }
@@ -217,7 +305,7 @@ export class MboxParser implements EmailParser {
   private extractMessageId(headers: Record<string, string>): string | undefined {
     if (headers['message-id']) {
       // Clean up Message-ID (remove angle brackets if present)
-      return headers['message-id'].replace(/^<|>$/g, '');
+      return normalizeMessageId(headers['message-id']);
     }
 
     logger.debug('MboxParser', 'Message-ID not found (rare for mbox format)');
@@ -261,18 +349,8 @@ export class MboxParser implements EmailParser {
       return 'unknown@example.com';
     }
 
-    // Try to extract email from angle brackets
-    const emailMatch = fromHeader.match(/<([^>]+)>/);
-    if (emailMatch) {
-      return emailMatch[1];
-    }
-
-    // Check if it's a plain email
-    if (fromHeader.includes('@')) {
-      return fromHeader;
-    }
-
-    return 'unknown@example.com';
+    // Angle-bracketed address, or the plain value if it is an email
+    return parseSenderAddress(fromHeader) ?? 'unknown@example.com';
   }
 
   /**
@@ -12,8 +12,32 @@ import { createHash } from 'crypto';
 import * as path from 'path';
 import { logger } from '../../config/logger.js';
 import type { EmailParser, ParsedEmail } from './EmailParser.js';
+import { parseSenderAddress } from './address.js';
+import { normalizeMessageId } from './messageId.js';
 import { formatISO8601 } from '../../../shared/utils/dateUtils.js';
 
+/**
+ * Pending msg-extractor import, shared by every parse call
+ *
+ * The optional dependency is still loaded lazily, but only resolved once
+ * instead of going through the dynamic import machinery for each file.
+ */
+let msgExtractorModule: Promise<typeof import('msg-extractor')> | undefined;
+
+/**
+ * Load msg-extractor on first use and reuse the module afterwards
+ *
+ * A failed import is not cached, so installing the dependency later
+ * does not require an application restart.
+ */
+function loadMsgExtractor(): Promise<typeof import('msg-extractor')> {
+  msgExtractorModule ??= import('msg-extractor').catch((error: unknown) => {
+    msgExtractorModule = undefined;
+    throw error;
+  });
+  return msgExtractorModule;
+}
+
 /**
  * MsgParser implements EmailParser interface for Outlook .msg files
  *
@@ -37,9 +61,8 @@ export class MsgParser implements EmailParser {
     try {
       logger.debug('MsgParser', `Starting parse for file: ${filePath}`);
 
-      // Dynamically import msg-extractor (optional dependency)
-      const msgExtractor = await import('msg-extractor');
-      const extractMsg = msgExtractor.extractMsg;
+      // Dynamically import msg-extractor (optional dependency, resolved once)
+      const { extractMsg } = await loadMsgExtractor();
 
       // Extract using msg-extractor
       const msg = await extractMsg(filePath);
@@ -108,12 +131,12 @@ export class MsgParser implements EmailParser {
     if (msg.headers && msg.headers['message-id']) {
       const messageId = msg.headers['message-id'];
       // Clean up Message-ID (remove angle brackets if present)
-      return messageId.replace(/^<|>$/g, '');
+      return normalizeMessageId(messageId);
     }
 
     // Some .msg files store Message-ID in internetMessageId field
     if (msg.internetMessageId) {
-      return msg.internetMessageId.replace(/^<|>$/g, '');
+      return normalizeMessageId(msg.internetMessageId);
     }
 
     logger.debug('MsgParser', 'Message-ID not found in .msg file (expected for ~15% of files per SC-004)');
@@ -152,14 +175,10 @@ export class MsgParser implements EmailParser {
    */
   private extractSenderEmail(msg: any): string {
     if (msg.sender) {
-      // Try to extract email from sender field
-      const emailMatch = msg.sender.match(/<([^>]+)>/);
-      if (emailMatch) {
-        return emailMatch[1];
-      }
-      // If no angle brackets, check if it's a plain email
-      if (msg.sender.includes('@')) {
-        return msg.sender;
+      // Angle-bracketed address, or the plain sender if it is an email
+      const address = parseSenderAddress(msg.sender);
+      if (address) {
+        return address;
       }
     }
 
@@ -48,6 +48,11 @@ export class ParserFactory {
    */
   private parsers: EmailParser[];
 
+  /**
+   * Parser for each supported extension, resolved once at construction
+   */
+  private parsersByExtension: Map<string, EmailParser>;
+
   constructor() {
     // Initialize all available parsers
     this.parsers = [
@@ -58,6 +63,16 @@ export class ParserFactory {
       new HtmlParser(),
     ];
 
+    // Every parser selects by extension, so dispatch can be a single map
+    // lookup instead of asking each parser in turn
+    this.parsersByExtension = new Map();
+    for (const ext of Object.values(EMAIL_FORMATS)) {
+      const parser = this.parsers.find((p) => p.canParse(`file${ext}`));
+      if (parser) {
+        this.parsersByExtension.set(ext, parser);
+      }
+    }
+
     logger.debug('ParserFactory', `Initialized with ${this.parsers.length} parsers`);
   }
 
@@ -93,14 +108,7 @@ export class ParserFactory {
    * @returns EmailParser instance or undefined if format not supported
    */
   getParser(filePath: string): EmailParser | undefined {
-    // Try to find a parser that can handle this file
-    for (const parser of this.parsers) {
-      if (parser.canParse(filePath)) {
-        return parser;
-      }
-    }
-
-    return undefined;
+    return this.parsersByExtension.get(path.extname(filePath).toLowerCase());
   }
 
   /**
@@ -12,12 +12,14 @@
  */
 
 import { createHash } from 'crypto';
-import { promises as fs } from 'fs';
+import { constants as fsConstants, promises as fs } from 'fs';
 import * as path from 'path';
 import { exec } from 'child_process';
 import { promisify } from 'util';
 import { logger } from '../../config/logger.js';
 import type { EmailParser, ParsedEmail } from './EmailParser.js';
+import { parseSenderAddress } from './address.js';
+import { normalizeMessageId } from './messageId.js';
 import { formatISO8601 } from '../../../shared/utils/dateUtils.js';
 
 const execAsync = promisify(exec);
@@ -42,6 +44,46 @@ export class PstParser implements EmailParser {
    */
   private static readonly TEMP_DIR = path.join(process.env.TMP || '/tmp', 'mailcopilot-pst');
 
+  /**
+   * Cached readpst probe resolving to the executable path, shared by all instances
+   *
+   * Only a successful probe is kept, so installing readpst while the app
+   * is running is picked up on the next parse.
+   */
+  private static readpstProbe: Promise<string> | null = null;
+
+  /**
+   * Pending or completed creation of TEMP_DIR, shared by all instances
+   *
+   * Cleared when creation or a parse fails, so a temp directory removed by
+   * the OS while the app is running is recreated on the next parse.
+   */
+  private static tempDirReady: Promise<void> | null = null;
+
+  /**
+   * readpst install locations keyed by platform
+   *
+   * Linux: distro packages and source installs. macOS: Homebrew on Apple
+   * Silicon and Intel, then MacPorts.
+   */
+  private static readonly READPST_KNOWN_PATHS_BY_PLATFORM: Partial<Record<NodeJS.Platform, readonly string[]>> = {
+    linux: ['/usr/bin/readpst', '/usr/local/bin/readpst'],
+    darwin: ['/opt/homebrew/bin/readpst', '/usr/local/bin/readpst', '/opt/local/bin/readpst'],
+  };
+
+  /**
+   * Standard readpst install locations for this platform, resolved once at load
+   *
+   * Other platforms check every location.
+   */
+  private static readonly READPST_KNOWN_PATHS =
+    PstParser.READPST_KNOWN_PATHS_BY_PLATFORM[process.platform] ?? [
+      '/usr/bin/readpst',
+      '/usr/local/bin/readpst',
+      '/opt/homebrew/bin/readpst',
+      '/opt/local/bin/readpst',
+    ];
+
   /**
    * Parse .pst/.ost file and extract metadata
    *
@@ -58,36 +100,45 @@ export class PstParser implements EmailParser {
       logger.debug('PstParser', `Starting parse for file: ${filePath}`);
 
       // Check if readpst is available
-      await this.checkReadpstAvailable();
+      const readpstPath = await this.checkReadpstAvailable();
 
-      // Create temp directory if it doesn't exist
-      await fs.mkdir(PstParser.TEMP_DIR, { recursive: true });
+      // Create temp directory if it doesn't exist (once per process)
+      await PstParser.ensureTempDir();
 
       // Extract emails using readpst
-      const extractedDir = await this.extractPst(filePath);
+      const extractedDir = await this.extractPst(readpstPath, filePath);
 
-      // Read first extracted email
+      // Find the first extracted email and count the rest in one pass over
+      // the listing (names only: no per-entry stat, no filtered copy)
       const extractedFiles = await fs.readdir(extractedDir);
-      const emlFiles = extractedFiles.filter(f => f.endsWith('.eml'));
+      let firstEmlFile: string | undefined;
+      let emlCount = 0;
+      for (const name of extractedFiles) {
+        if (name.endsWith('.eml')) {
+          firstEmlFile ??= name;
+          emlCount++;
+        }
+      }
 
-      if (emlFiles.length === 0) {
+      if (firstEmlFile === undefined) {
         throw new Error('No emails found in PST archive');
       }
 
       // Parse first email (for now - future enhancement: return all emails)
-      const firstEmailPath = path.join(extractedDir, emlFiles[0]);
+      const firstEmailPath = path.join(extractedDir, firstEmlFile);
 
       // Read and parse the .eml file
       const emlContent = await fs.readFile(firstEmailPath, 'utf-8');
       const parsed = await this.parseEmlContent(emlContent);
 
-      logger.debug('PstParser', `Successfully parsed PST archive with ${emlFiles.length} emails`);
+      logger.debug('PstParser', `Successfully parsed PST archive with ${emlCount} emails`);
 
       // Cleanup temp directory
       await this.cleanupTemp(extractedDir);
 
       return parsed;
     } catch (error) {
+      PstParser.tempDirReady = null;
       const errorMessage = error instanceof Error ? error.message : String(error);
       logger.error('PstParser', 'Failed to parse .pst/.ost file', error, { filePath });
 
@@ -109,14 +160,73 @@ export class PstParser implements EmailParser {
   /**
    * Check if readpst command is available
    *
+   * The probe runs once per process; later calls reuse the cached result.
+   * Standard install locations are checked first, then each PATH entry,
+   * all in-process (no `which` child process).
+   *
+   * @returns Absolute path of the readpst executable that was found
    * @throws Error if readpst not found
    */
-  private async checkReadpstAvailable(): Promise<void> {
-    try {
-      await execAsync('which readpst');
-    } catch {
-      throw new Error('readpst command not found. Please install libpss-tools: sudo apt-get install libpss-tools (Ubuntu/Debian) or brew install libpss (macOS)');
+  private async checkReadpstAvailable(): Promise<string> {
+    if (!PstParser.readpstProbe) {
+      PstParser.readpstProbe = this.locateReadpst().catch(() => {
+        PstParser.readpstProbe = null;
+        throw new Error('readpst command not found. Please install libpss-tools: sudo apt-get install libpss-tools (Ubuntu/Debian) or brew install libpss (macOS)');
+      });
     }
+
+    return PstParser.readpstProbe;
+  }
+
+  /**
+   * Create the shared extraction directory on first use
+   *
+   * Later parses reuse the settled promise instead of issuing another
+   * recursive mkdir for a directory that already exists.
+   */
+  private static ensureTempDir(): Promise<void> {
+    if (!PstParser.tempDirReady) {
+      PstParser.tempDirReady = fs.mkdir(PstParser.TEMP_DIR, { recursive: true }).then(
+        () => undefined,
+        (error: unknown) => {
+          PstParser.tempDirReady = null;
+          throw error;
+        }
+      );
+    }
+
+    return PstParser.tempDirReady;
+  }
+
+  /**
+   * Locate the readpst executable
+   *
+   * Walks the known install locations and then PATH the same way `which`
+   * does, testing each candidate for execute permission.
+   *
+   * @returns The first candidate that is executable; extraction runs this
+   *   path, so a known location that is not on PATH still works
+   * @throws Error if readpst is neither at a known path nor on PATH
+   */
+  private async locateReadpst(): Promise<string> {
+    const pathCandidates = (process.env.PATH ?? '')
+      .split(path.delimiter)
+      .filter((dir) => dir.length > 0)
+      .map((dir) => path.join(dir, 'readpst'));
+
+    // Known locations first; a Set skips PATH entries that repeat them
+    const candidates = new Set([...PstParser.READPST_KNOWN_PATHS, ...pathCandidates]);
+
+    for (const candidate of candidates) {
+      try {
+        await fs.access(candidate, fsConstants.X_OK);
+        return candidate;
+      } catch {
+        // Not installed here; try the next location
+      }
+    }
+
+    throw new Error('readpst not found on PATH');
   }
 
   /**
@@ -125,15 +235,16 @@ export class PstParser implements EmailParser {
    * Uses readpst command-line tool with -r option (recursive)
    * and -o option to specify output directory.
    *
+   * @param readpstPath - readpst executable located by the availability probe
    * @param filePath - Path to PST file
    * @returns Path to extracted directory
    */
-  private async extractPst(filePath: string): Promise<string> {
+  private async extractPst(readpstPath: string, filePath: string): Promise<string> {
     const outputDir = path.join(PstParser.TEMP_DIR, path.basename(filePath, path.extname(filePath)));
 
     try {
       // readpst command: -r (recursive), -o (output directory), -q (quiet)
-      const command = `readpst -r -o "${outputDir}" -q "${filePath}"`;
+      const command = `"${readpstPath}" -r -o "${outputDir}" -q "${filePath}"`;
       await execAsync(command);
 
       return outputDir;
@@ -168,7 +279,8 @@ export class PstParser implements EmailParser {
     }
 
     // Extract Message-ID
-    const messageId = headers['message-id']?.replace(/^<|>$/g, '');
+    const rawMessageId = headers['message-id'];
+    const messageId = rawMessageId !== undefined ? normalizeMessageId(rawMessageId) : undefined;
 
     // Extract date
     const dateStr = headers['date'] || headers['sent'];
@@ -230,18 +342,8 @@ export class PstParser implements EmailParser {
       return 'unknown@example.com';
     }
 
-    // Try to extract email from angle brackets
-    const emailMatch = fromHeader.match(/<([^>]+)>/);
-    if (emailMatch) {
-      return emailMatch[1];
-    }
-
-    // Check if it's a plain email
-    if (fromHeader.includes('@')) {
-      return fromHeader;
-    }
-
-    return 'unknown@example.com';
+    // Angle-bracketed address, or the plain value if it is an email
+    return parseSenderAddress(fromHeader) ?? 'unknown@example.com';
   }
 
   /**
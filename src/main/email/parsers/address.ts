@@ -0,0 +1,47 @@
+/**
+ * Sender address helpers shared by the header-based format parsers
+ *
+ * Mbox, PST, MSG and HTML parsers all receive the From value as a raw
+ * string (e.g. `"Alice" <alice@example.com>`) and need the bare address
+ * for the SHA-256 fingerprint per plan.md R0-4.
+ *
+ * @module main/email/parsers/address
+ */
+
+const LESS_THAN = '<';
+const GREATER_THAN = '>';
+
+/**
+ * Extract the bare email address from a raw From header value
+ *
+ * Equivalent to matching `/<([^>]+)>/` and falling back to the whole value
+ * when it contains '@', but scans with indexOf instead of running a regex
+ * for every email.
+ *
+ * @param value - Raw From header value
+ * @returns Address inside the first non-empty angle brackets, the value
+ *   itself if it looks like a plain address, or undefined otherwise
+ *
+ * @example
+ * ```typescript
+ * parseSenderAddress('"Alice" <alice@example.com>') // 'alice@example.com'
+ * parseSenderAddress('alice@example.com')           // 'alice@example.com'
+ * parseSenderAddress('Alice')                       // undefined
+ * ```
+ */
+export function parseSenderAddress(value: string): string | undefined {
+  let open = value.indexOf(LESS_THAN);
+  while (open !== -1) {
+    const close = value.indexOf(GREATER_THAN, open + 1);
+    if (close === -1) {
+      break;
+    }
+    if (close > open + 1) {
+      return value.slice(open + 1, close);
+    }
+    // Empty "<>" pair; the regex would retry from the next '<'
+    open = value.indexOf(LESS_THAN, open + 1);
+  }
+
+  return value.includes('@') ? value : undefined;
+}
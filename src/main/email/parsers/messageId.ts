@@ -0,0 +1,36 @@
+/**
+ * Message-ID helpers shared by all format parsers
+ *
+ * Per plan.md FR-001: Message-ID is the primary traceability key, so every
+ * parser must normalize it the same way before hashing and storage.
+ *
+ * @module main/email/parsers/messageId
+ */
+
+const LESS_THAN = 0x3c; // '<'
+const GREATER_THAN = 0x3e; // '>'
+
+/**
+ * Strip the angle brackets around a Message-ID header value
+ *
+ * Equivalent to `raw.replace(/^<|>$/g, '')`, but checks the first and last
+ * character codes directly instead of running a regex for every email.
+ *
+ * @param raw - Raw Message-ID header value (e.g. `<id@domain>`)
+ * @returns Message-ID without a leading '<' or trailing '>'
+ *
+ * @example
+ * ```typescript
+ * normalizeMessageId('<abc@example.com>') // 'abc@example.com'
+ * normalizeMessageId('abc@example.com')   // 'abc@example.com'
+ * ```
+ */
+export function normalizeMessageId(raw: string): string {
+  const start = raw.charCodeAt(0) === LESS_THAN ? 1 : 0;
+  const end =
+    raw.length > start && raw.charCodeAt(raw.length - 1) === GREATER_THAN
+      ? raw.length - 1
+      : raw.length;
+
+  return start === 0 && end === raw.length ? raw : raw.slice(start, end);
+}
@@ -15,7 +15,9 @@ import {
   FeedbackExportRequestSchema,
   type FeedbackExportResponse,
 } from '../../../shared/schemas/validation.js';
-import { promises as fs } from 'fs';
+import { createWriteStream } from 'fs';
+import { once } from 'events';
+import { finished } from 'stream/promises';
 
 /**
  * Generate unique request ID for tracking
@@ -140,16 +142,11 @@ export function registerExportHandlers(): void {
         item_count: feedbackData.length,
       });
 
-      // Generate export file content
-      let content: string;
-      if (format === 'json') {
-        content = generateJsonExport(feedbackData);
-      } else {
-        content = generateCsvExport(feedbackData);
-      }
-
-      // Write export file
-      await fs.writeFile(filePath, content, 'utf-8');
+      // Stream export file content (never held in memory as one string)
+      await writeExportFile(
+        filePath,
+        format === 'json' ? generateJsonExport(feedbackData) : generateCsvExport(feedbackData)
+      );
 
       logger.info('ExportHandler', 'Export file written successfully', {
         requestId,
@@ -326,13 +323,42 @@ async function queryFeedbackData(
   }>;
 }
 
+/**
+ * Write export content to disk chunk by chunk
+ *
+ * Respects stream backpressure, so only the chunks in flight are buffered.
+ *
+ * @param filePath - Destination file path
+ * @param chunks - Export content pieces, in order
+ */
+async function writeExportFile(filePath: string, chunks: Iterable<string>): Promise<void> {
+  const out = createWriteStream(filePath, { encoding: 'utf-8' });
+
+  try {
+    for (const chunk of chunks) {
+      if (!out.write(chunk)) {
+        await once(out, 'drain');
+      }
+    }
+    out.end();
+    await finished(out);
+  } catch (error) {
+    out.destroy();
+    throw error;
+  }
+}
+
 /**
  * Generate JSON export content
  *
+ * Yields the document piecewise (envelope, then one item at a time); the
+ * concatenation is identical to JSON.stringify of the whole export object
+ * with 2-space indentation.
+ *
  * @param feedbackData - Array of feedback data items
- * @returns JSON string
+ * @returns JSON string chunks
  */
-function generateJsonExport(
+function* generateJsonExport(
   feedbackData: Array<{
     item_id: string;
     content: string;
@@ -342,32 +368,56 @@ function generateJsonExport(
     feedback_type: string | null;
     created_at: string;
   }>
-): string {
-  const exportData = {
-    exported_at: new Date().toISOString(),
-    warning: '此文件包含未加密的反馈数据，请妥善保管',
-    total_items: feedbackData.length,
-    items: feedbackData.map((item) => ({
-      item_id: item.item_id,
-      content: item.content,
-      item_type: item.item_type,
-      confidence_score: item.confidence_score,
-      source_status: item.source_status,
-      feedback_type: item.feedback_type || 'correct', // null means marked as correct
-      created_at: item.created_at,
-    })),
-  };
-
-  return JSON.stringify(exportData, null, 2);
+): Generator<string> {
+  const envelope = JSON.stringify(
+    {
+      exported_at: new Date().toISOString(),
+      warning: '此文件包含未加密的反馈数据，请妥善保管',
+      total_items: feedbackData.length,
+    },
+    null,
+    2
+  );
+
+  // Reopen the envelope object (drop its closing "\n}") to append the items array
+  const head = envelope.slice(0, -2);
+
+  if (feedbackData.length === 0) {
+    yield `${head},\n  "items": []\n}`;
+    return;
+  }
+
+  yield `${head},\n  "items": [`;
+
+  for (let i = 0; i < feedbackData.length; i++) {
+    const item = feedbackData[i];
+    const itemJson = JSON.stringify(
+      {
+        item_id: item.item_id,
+        content: item.content,
+        item_type: item.item_type,
+        confidence_score: item.confidence_score,
+        source_status: item.source_status,
+        feedback_type: item.feedback_type || 'correct', // null means marked as correct
+        created_at: item.created_at,
+      },
+      null,
+      2
+    );
+    // Items sit two levels deep; string values never contain a raw newline
+    yield `${i === 0 ? '' : ','}\n    ${itemJson.replace(/\n/g, '\n    ')}`;
+  }
+
+  yield '\n  ]\n}';
 }
 
 /**
  * Generate CSV export content
  *
  * @param feedbackData - Array of feedback data items
- * @returns CSV string
+ * @returns CSV chunks (header, then one row per item)
  */
-function generateCsvExport(
+function* generateCsvExport(
   feedbackData: Array<{
     item_id: string;
     content: string;
@@ -377,16 +427,16 @@ function generateCsvExport(
     feedback_type: string | null;
     created_at: string;
   }>
-): string {
+): Generator<string> {
   // CSV header
-  const header = 'item_id,content,item_type,confidence_score,source_status,feedback_type,created_at';
+  yield 'item_id,content,item_type,confidence_score,source_status,feedback_type,created_at';
 
-  // CSV rows
-  const rows = feedbackData.map((item) => {
+  // CSV rows, each prefixed with the line separator
+  for (const item of feedbackData) {
     // Escape content field (may contain commas, quotes, newlines)
     const escapedContent = `"${item.content.replace(/"/g, '""')}"`;
 
-    return [
+    yield '\n' + [
       item.item_id,
       escapedContent,
       item.item_type,
@@ -395,10 +445,7 @@ function generateCsvExport(
       item.feedback_type || 'correct',
       item.created_at,
     ].join(',');
-  });
-
-  // Combine header and rows
-  return [header, ...rows].join('\n');
+  }
 }
 
 /**
@@ -72,8 +72,11 @@ async function saveAcknowledgment(db: Database): Promise<void> {
     db
       .prepare(
         `
-        INSERT OR REPLACE INTO app_metadata (key, value)
+        INSERT INTO app_metadata (key, value)
         VALUES (?, ?)
+        ON CONFLICT(key) DO UPDATE SET
+          value = excluded.value,
+          updated_at = excluded.updated_at
       `
       )
       .run(DISCLOSURE_KEY, JSON.stringify(data));
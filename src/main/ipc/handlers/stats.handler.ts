@@ -174,23 +174,21 @@ async function getFeedbackStats(month: string): Promise<{
   const { start, end } = getMonthBounds(month);
 
   // Query all items with feedback (feedback_type IS NOT NULL)
-  // created_at is Unix timestamp in seconds
+  // created_at is Unix timestamp in seconds. Only the columns the
+  // aggregation reads are fetched, and counts do not depend on row order.
   const stmt = db.prepare(`
     SELECT
       item_id,
-      feedback_type,
-      created_at
+      feedback_type
     FROM todo_items
     WHERE feedback_type IS NOT NULL
       AND created_at >= ?
       AND created_at <= ?
-    ORDER BY created_at DESC
   `);
 
   const rows = stmt.all(start, end) as Array<{
     item_id: string;
     feedback_type: Buffer | null;
-    created_at: number;
   }>;
 
   // Initialize statistics
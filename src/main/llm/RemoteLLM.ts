@@ -471,18 +471,9 @@ export class RemoteLLM implements LLMAdapter {
   private buildUserPrompt(batch: EmailBatch): string {
     const emailContents = batch.emails
       .map((email, index) => {
-        const parts = [
-          `Email ${index}:`,
-          `From: ${email.from}`,
-          `Subject: ${email.subject}`,
-          `Date: ${email.date}`,
-        ];
-
-        if (email.body) {
-          parts.push(`Body: ${email.body}`);
-        }
-
-        return parts.join('\n');
+        // Single template literal per email: no intermediate array + join
+        const header = `Email ${index}:\nFrom: ${email.from}\nSubject: ${email.subject}\nDate: ${email.date}`;
+        return email.body ? `${header}\nBody: ${email.body}` : header;
       })
       .join('\n\n---\n\n');
 
@@ -10,6 +10,11 @@
 
 import type { ParsedEmail } from '../email/parsers/EmailParser.js';
 
+/**
+ * First run of digits in rule evidence (e.g. the verb count in "Found 3 action verbs")
+ */
+const EVIDENCE_COUNT_PATTERN = /\d+/;
+
 /**
  * Rule execution result
  *
@@ -350,15 +355,39 @@ export function buildRuleDetails(results: RuleResult[]): {
   isWhitelistedSender: boolean;
   actionVerbCount: number;
 } {
+  let hasDeadlineKeyword = false;
+  let hasPriorityKeyword = false;
+  let isWhitelistedSender = false;
+  let actionVerbs: RuleResult | undefined;
+
+  // Single pass over the results instead of one scan per detail field
+  for (const result of results) {
+    switch (result.ruleName) {
+      case 'deadline_keywords':
+        hasDeadlineKeyword ||= result.triggered;
+        break;
+      case 'priority_keywords':
+        hasPriorityKeyword ||= result.triggered;
+        break;
+      case 'whitelisted_sender':
+        isWhitelistedSender ||= result.triggered;
+        break;
+      case 'action_verbs':
+        actionVerbs ??= result;
+        break;
+    }
+  }
+
+  // Verb count is parsed once from the first action_verbs result's evidence
+  const count = actionVerbs?.triggered
+    ? actionVerbs.evidence.match(EVIDENCE_COUNT_PATTERN)?.[0]
+    : undefined;
+
   return {
-    hasDeadlineKeyword: results.some((r) => r.ruleName === 'deadline_keywords' && r.triggered),
-    hasPriorityKeyword: results.some((r) => r.ruleName === 'priority_keywords' && r.triggered),
-    isWhitelistedSender: results.some((r) => r.ruleName === 'whitelisted_sender' && r.triggered),
-    actionVerbCount: results.find((r) => r.ruleName === 'action_verbs')?.triggered
-      ? results.find((r) => r.ruleName === 'action_verbs')!.evidence.match(/\d+/)?.[0]
-        ? parseInt(results.find((r) => r.ruleName === 'action_verbs')!.evidence.match(/\d+/)![0], 10)
-        : 0
-      : 0,
+    hasDeadlineKeyword,
+    hasPriorityKeyword,
+    isWhitelistedSender,
+    actionVerbCount: count ? parseInt(count, 10) : 0,
   };
 }
 
@@ -11,6 +11,27 @@
 
 import { format, parseISO, isValid, formatISO } from 'date-fns';
 
+/**
+ * Format a valid Date as local YYYY-MM-DD
+ *
+ * Same output as date-fns `format(date, 'yyyy-MM-dd')` but built directly
+ * from the date fields, skipping the per-call format pattern parsing.
+ * Years outside 1-9999 go through date-fns (era-year and padding rules).
+ *
+ * @param date - Valid Date object
+ * @returns Date in YYYY-MM-DD format (local time)
+ */
+function toYYYYMMDD(date: Date): string {
+  const year = date.getFullYear();
+  if (year < 1 || year > 9999) {
+    return format(date, 'yyyy-MM-dd');
+  }
+
+  const month = date.getMonth() + 1;
+  const day = date.getDate();
+  return `${String(year).padStart(4, '0')}-${month < 10 ? '0' : ''}${month}-${day < 10 ? '0' : ''}${day}`;
+}
+
 /**
  * Format date as YYYY-MM-DD (ISO date-only format)
  *
@@ -39,18 +60,18 @@ export function formatYYYYMMDD(dateInput: string | Date | number): string {
       date = new Date(dateInput);
     } else {
       // Fallback to current date for invalid input
-      return format(new Date(), 'yyyy-MM-dd');
+      return toYYYYMMDD(new Date());
     }
 
     // Validate date
     if (!isValid(date)) {
-      return format(new Date(), 'yyyy-MM-dd');
+      return toYYYYMMDD(new Date());
     }
 
-    return format(date, 'yyyy-MM-dd');
+    return toYYYYMMDD(date);
   } catch {
     // On any error, return current date
-    return format(new Date(), 'yyyy-MM-dd');
+    return toYYYYMMDD(new Date());
   }
 }
 
@@ -97,6 +118,17 @@ export function formatISO8601(dateInput: string | Date | number): string {
   }
 }
 
+/**
+ * Check whether a string starts with an ASCII letter
+ *
+ * @param value - String to check
+ * @returns true if the first character is A-Z or a-z
+ */
+function startsWithLetter(value: string): boolean {
+  const code = value.charCodeAt(0) | 0x20; // fold to lower case
+  return code >= 0x61 && code <= 0x7a;
+}
+
 /**
  * Parse email date header to ISO 8601 string
  *
@@ -118,8 +150,10 @@ export function parseEmailDate(dateHeader: string): string {
       return formatISO(new Date());
     }
 
-    // Try parsing as ISO first (fastest path)
-    let date = parseISO(dateHeader);
+    // Canonical RFC 5322 headers start with a day name ("Wed, 21 Feb 2024 ...").
+    // parseISO needs a leading digit or sign, so for those go straight to the
+    // native parser instead of attempting (and failing) an ISO parse first
+    let date = startsWithLetter(dateHeader) ? new Date(dateHeader) : parseISO(dateHeader);
 
     // If ISO parsing fails, try RFC 5322 format
     if (!isValid(date)) {
@@ -221,7 +255,35 @@ export function getCurrentDateISO(): string {
  * ```
  */
 export function getCurrentDateYYYYMMDD(): string {
-  return format(new Date(), 'yyyy-MM-dd');
+  return toYYYYMMDD(new Date());
+}
+
+/**
+ * Display formatters by locale
+ *
+ * Constructing an Intl.DateTimeFormat resolves the locale and options, which
+ * costs far more than formatting; build each one once and reuse it.
+ */
+const displayFormatters = new Map<string, Intl.DateTimeFormat>();
+
+/**
+ * Get the cached long-date display formatter for a locale
+ *
+ * @param locale - BCP 47 locale tag
+ * @returns Formatter for year, long month name and day
+ * @throws RangeError if the locale tag is invalid (nothing is cached)
+ */
+function getDisplayFormatter(locale: string): Intl.DateTimeFormat {
+  let formatter = displayFormatters.get(locale);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat(locale, {
+      year: 'numeric',
+      month: 'long',
+      day: 'numeric',
+    });
+    displayFormatters.set(locale, formatter);
+  }
+  return formatter;
 }
 
 /**
@@ -261,11 +323,7 @@ export function formatDateForDisplay(
     }
 
     // Use Intl.DateTimeFormat for locale-aware formatting
-    return new Intl.DateTimeFormat(locale, {
-      year: 'numeric',
-      month: 'long',
-      day: 'numeric',
-    }).format(date);
+    return getDisplayFormatter(locale).format(date);
   } catch {
     return '';
   }
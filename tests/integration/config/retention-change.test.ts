@@ -524,13 +524,16 @@ describe('T096: Immediate Cleanup on Retention Change Integration Tests', () =>
       const now = Math.floor(Date.now() / 1000);
       const fortyDaysAgo = now - (40 * 24 * 60 * 60);
 
-      // Insert multiple records
-      for (let i = 0; i < 10; i++) {
-        db.prepare(`
-          INSERT INTO processed_emails (email_hash, processed_at, last_seen_at, report_date, extract_status)
-          VALUES (?, ?, ?, ?, ?)
-        `).run(`email_${i}`, fortyDaysAgo, fortyDaysAgo, '2024-01-01', 'success');
-      }
+      // Insert multiple records in one transaction with a single prepared statement
+      const insertEmail = db.prepare(`
+        INSERT INTO processed_emails (email_hash, processed_at, last_seen_at, report_date, extract_status)
+        VALUES (?, ?, ?, ?, ?)
+      `);
+      db.transaction(() => {
+        for (let i = 0; i < 10; i++) {
+          insertEmail.run(`email_${i}`, fortyDaysAgo, fortyDaysAgo, '2024-01-01', 'success');
+        }
+      })();
 
       // Mock DataRetentionConfigRepository.get
       vi.spyOn(DataRetentionConfigRepository, 'get').mockResolvedValue({
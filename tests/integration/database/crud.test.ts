@@ -176,29 +176,32 @@ describe('T020: Database CRUD Integration Tests', () => {
       const itemId = 'item-1';
       const emailHash = 'email-hash-123';
 
-      // Insert report
-      testDb.prepare(`
-        INSERT INTO daily_reports (report_date, generation_mode, completed_count, pending_count, content_encrypted, content_checksum, source_email_hashes)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-      `).run(reportDate, 'local', 0, 0, blobify({}), 'checksum', '[]');
+      // Seed all rows in one transaction instead of one commit per insert
+      testDb.transaction(() => {
+        // Insert report
+        testDb.prepare(`
+          INSERT INTO daily_reports (report_date, generation_mode, completed_count, pending_count, content_encrypted, content_checksum, source_email_hashes)
+          VALUES (?, ?, ?, ?, ?, ?, ?)
+        `).run(reportDate, 'local', 0, 0, blobify({}), 'checksum', '[]');
 
-      // Insert item
-      testDb.prepare(`
-        INSERT INTO todo_items (item_id, report_date, content_encrypted, content_checksum, item_type, source_status, confidence_score)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-      `).run(itemId, reportDate, blobify('encrypted'), 'checksum', 'pending', 'verified', 0.8);
+        // Insert item
+        testDb.prepare(`
+          INSERT INTO todo_items (item_id, report_date, content_encrypted, content_checksum, item_type, source_status, confidence_score)
+          VALUES (?, ?, ?, ?, ?, ?, ?)
+        `).run(itemId, reportDate, blobify('encrypted'), 'checksum', 'pending', 'verified', 0.8);
 
-      // Insert email
-      testDb.prepare(`
-        INSERT INTO processed_emails (email_hash, processed_at, last_seen_at, extract_status)
-        VALUES (?, ?, ?, ?)
-      `).run(emailHash, 1000, 1000, 'success');
+        // Insert email
+        testDb.prepare(`
+          INSERT INTO processed_emails (email_hash, processed_at, last_seen_at, extract_status)
+          VALUES (?, ?, ?, ?)
+        `).run(emailHash, 1000, 1000, 'success');
 
-      // Insert item-email ref
-      testDb.prepare(`
-        INSERT INTO item_email_refs (ref_id, item_id, email_hash, evidence_text, confidence)
-        VALUES (?, ?, ?, ?, ?)
-      `).run('ref-1', itemId, emailHash, 'evidence text', 90);
+        // Insert item-email ref
+        testDb.prepare(`
+          INSERT INTO item_email_refs (ref_id, item_id, email_hash, evidence_text, confidence)
+          VALUES (?, ?, ?, ?, ?)
+        `).run('ref-1', itemId, emailHash, 'evidence text', 90);
+      })();
 
       // Verify ref exists
       let refCount = testDb.prepare('SELECT COUNT(*) as count FROM item_email_refs WHERE item_id = ?').get(itemId) as any;
@@ -468,23 +471,25 @@ describe('T020: Database CRUD Integration Tests', () => {
     it('should auto-update daily_reports counts when todo_items inserted', () => {
       const reportDate = '2024-01-27';
 
-      // Insert report with zero counts
-      testDb.prepare(`
-        INSERT INTO daily_reports (report_date, generation_mode, completed_count, pending_count, content_encrypted, content_checksum, source_email_hashes)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-      `).run(reportDate, 'local', 0, 0, blobify({}), 'checksum', '[]');
+      testDb.transaction(() => {
+        // Insert report with zero counts
+        testDb.prepare(`
+          INSERT INTO daily_reports (report_date, generation_mode, completed_count, pending_count, content_encrypted, content_checksum, source_email_hashes)
+          VALUES (?, ?, ?, ?, ?, ?, ?)
+        `).run(reportDate, 'local', 0, 0, blobify({}), 'checksum', '[]');
 
-      // Insert completed item
-      testDb.prepare(`
-        INSERT INTO todo_items (item_id, report_date, content_encrypted, content_checksum, item_type, source_status, confidence_score)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-      `).run('item-1', reportDate, blobify('encrypted'), 'checksum', 'completed', 'verified', 0.9);
+        // Insert completed item
+        testDb.prepare(`
+          INSERT INTO todo_items (item_id, report_date, content_encrypted, content_checksum, item_type, source_status, confidence_score)
+          VALUES (?, ?, ?, ?, ?, ?, ?)
+        `).run('item-1', reportDate, blobify('encrypted'), 'checksum', 'completed', 'verified', 0.9);
 
-      // Insert pending item
-      testDb.prepare(`
-        INSERT INTO todo_items (item_id, report_date, content_encrypted, content_checksum, item_type, source_status, confidence_score)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-      `).run('item-2', reportDate, blobify('encrypted'), 'checksum', 'pending', 'verified', 0.7);
+        // Insert pending item
+        testDb.prepare(`
+          INSERT INTO todo_items (item_id, report_date, content_encrypted, content_checksum, item_type, source_status, confidence_score)
+          VALUES (?, ?, ?, ?, ?, ?, ?)
+        `).run('item-2', reportDate, blobify('encrypted'), 'checksum', 'pending', 'verified', 0.7);
+      })();
 
       // Verify counts auto-updated
       const report = testDb.prepare('SELECT completed_count, pending_count FROM daily_reports WHERE report_date = ?').get(reportDate) as any;
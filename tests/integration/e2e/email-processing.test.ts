@@ -36,7 +36,9 @@ import { generateKey } from '@/config/encryption';
 import type { CryptoKey } from '@/config/encryption';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
-const TEST_DB_PATH = path.join(__dirname, '.temp', 'e2e-test.db');
+const TEMP_DIR = path.join(__dirname, '.temp');
+const TEST_DB_PATH = path.join(TEMP_DIR, 'e2e-test.db');
+const INVALID_EMAIL_PATH = path.join(TEMP_DIR, 'invalid.eml');
 
 /**
  * Sample .eml file content with action items
@@ -109,8 +111,12 @@ function setupTestDatabase(): Database.Database {
   }
 
   const db = new Database(TEST_DB_PATH);
-  db.pragma('journal_mode = WAL');
-  db.pragma('synchronous = NORMAL');
+  // Throwaway database: skip fsync, journaling and file locking so each
+  // insert does not wait on the disk. Production keeps WAL + NORMAL.
+  db.pragma('synchronous = OFF');
+  db.pragma('journal_mode = OFF');
+  db.pragma('locking_mode = EXCLUSIVE');
+  db.pragma('temp_store = MEMORY');
   db.pragma('foreign_keys = ON');
 
   // Load schema
@@ -125,7 +131,7 @@ function setupTestDatabase(): Database.Database {
  * Create temporary .eml files for testing
  */
 function createTempEmailFiles(): Map<string, string> {
-  const tempDir = path.join(__dirname, '.temp', 'emails');
+  const tempDir = path.join(TEMP_DIR, 'emails');
   if (!fs.existsSync(tempDir)) {
     fs.mkdirSync(tempDir, { recursive: true });
   }
@@ -172,9 +178,8 @@ function cleanupTestDatabase(db: Database.Database) {
   }
 
   // Clean up temp email files
-  const tempDir = path.join(__dirname, '.temp');
-  if (fs.existsSync(tempDir)) {
-    fs.rmSync(tempDir, { recursive: true, force: true });
+  if (fs.existsSync(TEMP_DIR)) {
+    fs.rmSync(TEMP_DIR, { recursive: true, force: true });
   }
 }
 
@@ -183,6 +188,20 @@ describe('T113: End-to-End Email Processing Workflow', () => {
   let encryptionKey: CryptoKey;
   let tempEmailFiles: Map<string, string>;
 
+  // Each fixture file is parsed once and the result shared by every test
+  // that only reads it; tests must not mutate the returned ParsedEmail.
+  const parsedFixtures = new Map<string, Promise<ParsedEmail>>();
+
+  function parseFixture(name: string): Promise<ParsedEmail> {
+    let parsed = parsedFixtures.get(name);
+    if (!parsed) {
+      const filePath = tempEmailFiles.get(name)!;
+      parsed = ParserFactory.getParser(filePath).parse(filePath);
+      parsedFixtures.set(name, parsed);
+    }
+    return parsed;
+  }
+
   beforeAll(async () => {
     // Setup test database
     db = setupTestDatabase();
@@ -212,8 +231,7 @@ describe('T113: End-to-End Email Processing Workflow', () => {
       expect(fs.existsSync(emailFilePath)).toBe(true);
 
       // Step 2: Parse email
-      const parser = ParserFactory.getParser(emailFilePath);
-      const parsedEmail: ParsedEmail = await parser.parse(emailFilePath);
+      const parsedEmail: ParsedEmail = await parseFixture('email1');
 
       // Verify email parsing
       expect(parsedEmail.message_id).toBe('<test-action-items@example.com>');
@@ -340,9 +358,7 @@ describe('T113: End-to-End Email Processing Workflow', () => {
 
     it('should generate search string that locates email within 60 seconds', async () => {
       // Process email
-      const emailFilePath = tempEmailFiles.get('email1')!;
-      const parser = ParserFactory.getParser(emailFilePath);
-      const parsedEmail = await parser.parse(emailFilePath);
+      const parsedEmail = await parseFixture('email1');
 
       // Generate search string
       const traceability = TraceabilityGenerator.generate({
@@ -385,8 +401,7 @@ describe('T113: End-to-End Email Processing Workflow', () => {
     it('should handle emails without Message-ID using SHA-256 fingerprint', async () => {
       // Process email without Message-ID
       const emailFilePath = tempEmailFiles.get('email3')!;
-      const parser = ParserFactory.getParser(emailFilePath);
-      const parsedEmail = await parser.parse(emailFilePath);
+      const parsedEmail = await parseFixture('email3');
 
       // Verify fallback to fingerprint
       expect(parsedEmail.message_id).toBe('');
@@ -422,8 +437,7 @@ describe('T113: End-to-End Email Processing Workflow', () => {
 
       // First processing
       const detector = new DuplicateDetector();
-      const parser = ParserFactory.getParser(emailFilePath);
-      const parsedEmail = await parser.parse(emailFilePath);
+      const parsedEmail = await parseFixture('email1');
 
       // Check duplicate (first time - should not be duplicate)
       const firstCheck = await detector.checkDuplicate(parsedEmail);
@@ -452,14 +466,10 @@ describe('T113: End-to-End Email Processing Workflow', () => {
   describe('Confidence-Based Processing', () => {
     it('should apply correct confidence scores based on content clarity', async () => {
       // Process clear email
-      const clearEmailPath = tempEmailFiles.get('email1')!;
-      const parser1 = ParserFactory.getParser(clearEmailPath);
-      const clearEmail = await parser1.parse(clearEmailPath);
+      const clearEmail = await parseFixture('email1');
 
       // Process ambiguous email
-      const ambiguousEmailPath = tempEmailFiles.get('email2')!;
-      const parser2 = ParserFactory.getParser(ambiguousEmailPath);
-      const ambiguousEmail = await parser2.parse(ambiguousEmailPath);
+      const ambiguousEmail = await parseFixture('email2');
 
       // Verify both emails parsed successfully
       expect(clearEmail.extract_status).toBe('success');
@@ -499,7 +509,7 @@ describe('T113: End-to-End Email Processing Workflow', () => {
   describe('Error Handling', () => {
     it('should gracefully handle parsing errors', async () => {
       // Create invalid email file
-      const invalidEmailPath = path.join(__dirname, '.temp', 'invalid.eml');
+      const invalidEmailPath = INVALID_EMAIL_PATH;
       fs.writeFileSync(invalidEmailPath, 'Invalid email content');
 
       // Attempt to parse
@@ -524,7 +534,7 @@ describe('T113: End-to-End Email Processing Workflow', () => {
     it('should handle batch processing with mixed valid and invalid emails', async () => {
       // Mix of valid and invalid email files
       const validEmailPath = tempEmailFiles.get('email1')!;
-      const invalidEmailPath = path.join(__dirname, '.temp', 'invalid.eml');
+      const invalidEmailPath = INVALID_EMAIL_PATH;
       fs.writeFileSync(invalidEmailPath, 'Invalid content');
 
       // Mock LLM adapter
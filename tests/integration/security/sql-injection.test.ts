@@ -15,10 +15,8 @@
  * - All SQL injection vectors must be tested
  */
 
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, beforeAll, afterAll, beforeEach, afterEach } from 'vitest';
 import Database from 'better-sqlite3';
-import fs from 'fs';
-import path from 'path';
 import { EmailSourceRepository } from '../../../src/main/database/entities/EmailSource';
 import { ActionItemRepository } from '../../../src/main/database/entities/ActionItem';
 import { ItemEmailRefRepository } from '../../../src/main/database/entities/ItemEmailRef';
@@ -26,18 +24,15 @@ import DatabaseManager from '../../../src/main/database/Database';
 
 describe('Security Audit: SQL Injection', () => {
   let db: Database.Database;
-  let testDbPath: string;
 
-  beforeEach(async () => {
-    // Create in-memory database for testing
-    testDbPath = path.join('/tmp', `test-sql-injection-${Date.now()}.db`);
-
-    // Initialize database
-    db = new Database(testDbPath);
+  // Schema is built once per file; each test runs inside a savepoint that is
+  // rolled back afterwards, so tests still start from empty tables
+  beforeAll(async () => {
+    // In-memory database: these tests check query behavior, not durability,
+    // so no file, fsync or WAL is needed
+    db = new Database(':memory:');
 
     // Enable required pragmas
-    db.pragma('journal_mode = WAL');
-    db.pragma('synchronous = NORMAL');
     db.pragma('foreign_keys = ON');
 
     // Create test schema
@@ -84,13 +79,18 @@ describe('Security Audit: SQL Injection', () => {
     `);
   });
 
+  beforeEach(() => {
+    db.exec('SAVEPOINT test_case');
+  });
+
   afterEach(() => {
+    db.exec('ROLLBACK TO test_case; RELEASE test_case');
+  });
+
+  afterAll(() => {
     if (db) {
       db.close();
     }
-    if (fs.existsSync(testDbPath)) {
-      fs.unlinkSync(testDbPath);
-    }
   });
 
   describe('Parameterized Query Verification', () => {
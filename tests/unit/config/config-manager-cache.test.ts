@@ -0,0 +1,176 @@
+/**
+ * Unit Tests: ConfigManager decrypted value cache
+ *
+ * - Repeated reads are served from memory
+ * - Returned objects are the caller's own copies
+ * - A load in flight never overwrites a concurrent set() or delete()
+ * - Cached values are dropped when the database connection changes
+ */
+
+import { describe, it, expect, beforeAll, beforeEach, afterEach, vi } from 'vitest';
+import Database from 'better-sqlite3';
+import { ConfigManager } from '../../../src/main/config/ConfigManager';
+import DatabaseManager from '../../../src/main/database/Database';
+import * as encryption from '../../../src/main/config/encryption';
+import type { CryptoKey } from '../../../src/main/config/encryption';
+
+// Lets a test park decryptField() mid-load to interleave writes with it
+const decryptGate = vi.hoisted(() => ({ hold: null as Promise<void> | null }));
+
+vi.mock('../../../src/main/config/encryption', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('../../../src/main/config/encryption')>();
+  return {
+    ...actual,
+    decryptField: vi.fn(async (key: CryptoKey, blob: string) => {
+      if (decryptGate.hold) {
+        await decryptGate.hold;
+      }
+      return actual.decryptField(key, blob);
+    }),
+  };
+});
+
+type ConfigManagerState = {
+  isInitialized: boolean;
+  encryptionKey: CryptoKey | null;
+  hmacKey: CryptoKey | null;
+  cacheSource: Database.Database | null;
+};
+
+function createConfigDatabase(): Database.Database {
+  const database = new Database(':memory:');
+  database.exec(`
+    CREATE TABLE user_config (
+      config_key TEXT PRIMARY KEY,
+      config_value BLOB NOT NULL,
+      updated_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now'))
+    ) STRICT;
+  `);
+  return database;
+}
+
+describe('ConfigManager value cache', () => {
+  const state = ConfigManager as unknown as ConfigManagerState;
+  let encryptionKey: CryptoKey;
+  let hmacKey: CryptoKey;
+  let db: Database.Database;
+
+  /** Forget cached values so the next read goes back to the database */
+  const dropCache = () => {
+    state.cacheSource = null;
+  };
+
+  /** Hold every decryptField() call until the returned release function runs */
+  const holdDecrypts = (): (() => void) => {
+    let release!: () => void;
+    decryptGate.hold = new Promise<void>((resolve) => {
+      release = resolve;
+    });
+    return release;
+  };
+
+  beforeAll(async () => {
+    encryptionKey = await encryption.generateKey();
+    hmacKey = await encryption.generateHMACKey();
+  });
+
+  beforeEach(() => {
+    db = createConfigDatabase();
+    vi.spyOn(DatabaseManager, 'getDatabase').mockReturnValue(db);
+
+    // Skip safeStorage key loading; the cache is what is under test
+    state.isInitialized = true;
+    state.encryptionKey = encryptionKey;
+    state.hmacKey = hmacKey;
+    dropCache();
+
+    vi.mocked(encryption.decryptField).mockClear();
+  });
+
+  afterEach(() => {
+    decryptGate.hold = null;
+    db.close();
+    vi.restoreAllMocks();
+  });
+
+  it('should decrypt each value once across repeated reads', async () => {
+    await ConfigManager.set({ 'ui.theme': 'dark' });
+    dropCache();
+
+    await ConfigManager.get();
+    await ConfigManager.get();
+    await ConfigManager.get(['ui.theme']);
+
+    expect(encryption.decryptField).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not let callers mutate cached values through get()', async () => {
+    await ConfigManager.set({ 'ui.layout': { panels: ['inbox'] } });
+
+    const first = await ConfigManager.get();
+    first['ui.layout'].panels.push('reports');
+    first['ui.theme'] = 'dark';
+
+    expect(await ConfigManager.get()).toEqual({ 'ui.layout': { panels: ['inbox'] } });
+  });
+
+  it('should keep a set() that lands while a read is decrypting', async () => {
+    await ConfigManager.set({ 'ui.theme': 'dark' });
+    dropCache();
+
+    const release = holdDecrypts();
+    const pending = ConfigManager.get(['ui.theme']);
+    await vi.waitFor(() => expect(encryption.decryptField).toHaveBeenCalled());
+
+    await ConfigManager.set({ 'ui.theme': 'light' });
+    release();
+
+    expect((await pending)['ui.theme']).toBe('light');
+    expect((await ConfigManager.get(['ui.theme']))['ui.theme']).toBe('light');
+  });
+
+  it('should not re-add a key deleted while a full read is decrypting', async () => {
+    await ConfigManager.set({ 'ui.theme': 'dark', 'ui.language': 'en-US' });
+    dropCache();
+
+    const release = holdDecrypts();
+    const pending = ConfigManager.get();
+    await vi.waitFor(() => expect(encryption.decryptField).toHaveBeenCalled());
+
+    await ConfigManager.delete(['ui.theme']);
+    release();
+
+    expect(await pending).toEqual({ 'ui.language': 'en-US' });
+    expect(await ConfigManager.get()).toEqual({ 'ui.language': 'en-US' });
+    expect(await ConfigManager.get(['ui.theme'])).toEqual({});
+  });
+
+  it('should drop a deleted key from the cache', async () => {
+    await ConfigManager.set({ 'ui.theme': 'dark' });
+    await ConfigManager.get();
+
+    await ConfigManager.delete(['ui.theme']);
+
+    expect(await ConfigManager.get()).toEqual({});
+    expect(await ConfigManager.get(['ui.theme'])).toEqual({});
+  });
+
+  it('should reload values when the database connection changes', async () => {
+    await ConfigManager.set({ 'ui.theme': 'dark' });
+    expect(await ConfigManager.get()).toEqual({ 'ui.theme': 'dark' });
+
+    const other = createConfigDatabase();
+    try {
+      vi.mocked(DatabaseManager.getDatabase).mockReturnValue(other);
+      expect(await ConfigManager.get()).toEqual({});
+
+      await ConfigManager.set({ 'ui.theme': 'light' });
+      expect(await ConfigManager.get(['ui.theme'])).toEqual({ 'ui.theme': 'light' });
+
+      vi.mocked(DatabaseManager.getDatabase).mockReturnValue(db);
+      expect(await ConfigManager.get()).toEqual({ 'ui.theme': 'dark' });
+    } finally {
+      other.close();
+    }
+  });
+});
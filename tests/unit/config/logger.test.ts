@@ -3,7 +3,7 @@
  * Verify electron-log v5 configuration and API
  */
 
-import { describe, it, expect } from 'vitest';
+import { describe, it, expect, vi } from 'vitest';
 
 describe('Logger Configuration', () => {
   it('should export logger object with all required methods', async () => {
@@ -54,6 +54,23 @@ describe('Logger Configuration', () => {
     expect(() => logger.error('TestModule', 'Error occurred', testError)).not.toThrow();
   });
 
+  it('should pass each entry to electron-log as one JSON line', async () => {
+    const { logger } = await import('@/config/logger');
+    const log = (await import('electron-log')).default;
+
+    logger.warn('TestModule', 'Cleanup failed', { error: new Error('EBUSY'), size: BigInt(42) });
+
+    const line = vi.mocked(log.warn).mock.calls.at(-1)?.[0];
+    expect(line).toBeTypeOf('string');
+    expect(JSON.parse(line as string)).toMatchObject({
+      level: 'WARN',
+      module: 'TestModule',
+      message: 'Cleanup failed',
+      error: { name: 'Error', message: 'EBUSY' },
+      size: '42',
+    });
+  });
+
   it('should handle context ID functions', async () => {
     const { setContextId, clearContextId } = await import('@/config/logger');
 
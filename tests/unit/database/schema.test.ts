@@ -0,0 +1,102 @@
+/**
+ * Unit Tests: SchemaManager initialization fast path
+ *
+ * - A stamped database skips the version check and index DDL
+ * - reset() clears the stamp so the schema is rebuilt
+ * - Indexes added after release are created on upgraded databases
+ * - A schema_version mismatch is never stamped
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import Database from 'better-sqlite3';
+import DatabaseManager from '../../../src/main/database/Database';
+import { SchemaManager } from '../../../src/main/database/schema';
+
+vi.mock('../../../src/main/config/logger', () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    warn: vi.fn(),
+    debug: vi.fn(),
+  },
+}));
+
+describe('SchemaManager.initialize', () => {
+  let db: Database.Database;
+  let warnSpy: ReturnType<typeof vi.spyOn>;
+
+  const userVersion = () => db.pragma('user_version', { simple: true }) as number;
+
+  beforeEach(() => {
+    db = new Database(':memory:');
+    vi.spyOn(DatabaseManager, 'getDatabase').mockReturnValue(db);
+    vi.spyOn(console, 'log').mockImplementation(() => {});
+    warnSpy = vi.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    db.close();
+    vi.restoreAllMocks();
+  });
+
+  it('should stamp user_version after creating the schema', async () => {
+    await SchemaManager.initialize();
+
+    expect(SchemaManager.tableExists('todo_items')).toBe(true);
+    expect(userVersion()).not.toBe(0);
+    expect(warnSpy).not.toHaveBeenCalled();
+  });
+
+  it('should take the fast path once the database is stamped', async () => {
+    await SchemaManager.initialize();
+    const stamped = userVersion();
+
+    // Only the full path would recreate this index
+    db.exec('DROP INDEX idx_items_feedback_created');
+    await SchemaManager.initialize();
+
+    expect(SchemaManager.indexExists('idx_items_feedback_created')).toBe(false);
+    expect(userVersion()).toBe(stamped);
+  });
+
+  it('should rebuild the schema after reset()', async () => {
+    await SchemaManager.initialize();
+    const stamped = userVersion();
+
+    SchemaManager.reset();
+    expect(userVersion()).toBe(0);
+    expect(SchemaManager.tableExists('todo_items')).toBe(false);
+
+    await SchemaManager.initialize();
+
+    expect(SchemaManager.tableExists('todo_items')).toBe(true);
+    expect(userVersion()).toBe(stamped);
+  });
+
+  it('should add indexes missing from a database created before they shipped', async () => {
+    await SchemaManager.initialize();
+
+    // Database from an older build: tables present, index absent, unstamped
+    db.exec('DROP INDEX idx_items_feedback_created');
+    db.pragma('user_version = 0');
+
+    await SchemaManager.initialize();
+
+    expect(SchemaManager.indexExists('idx_items_feedback_created')).toBe(true);
+    expect(userVersion()).not.toBe(0);
+  });
+
+  it('should not stamp a database whose schema_version does not match', async () => {
+    await SchemaManager.initialize();
+    db.prepare("UPDATE app_metadata SET value = '0.9' WHERE key = 'schema_version'").run();
+    db.pragma('user_version = 0');
+
+    await SchemaManager.initialize();
+    expect(userVersion()).toBe(0);
+    expect(warnSpy).toHaveBeenCalledWith(expect.stringContaining('got 0.9'));
+
+    // The check runs again on the next start instead of being skipped
+    await SchemaManager.initialize();
+    expect(warnSpy).toHaveBeenCalledTimes(2);
+  });
+});
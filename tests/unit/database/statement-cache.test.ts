@@ -0,0 +1,66 @@
+/**
+ * Unit Tests: DatabaseManager prepared statement cache
+ *
+ * - Same SQL text reuses the statement prepared on the first call
+ * - Statements are never shared across connections
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import Database from 'better-sqlite3';
+import DatabaseManager from '../../../src/main/database/Database';
+
+vi.mock('../../../src/main/config/logger', () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    warn: vi.fn(),
+    debug: vi.fn(),
+  },
+}));
+
+describe('DatabaseManager.prepare', () => {
+  let db: Database.Database;
+
+  beforeEach(() => {
+    db = new Database(':memory:');
+    db.exec('CREATE TABLE items (id TEXT PRIMARY KEY)');
+    vi.spyOn(DatabaseManager, 'getDatabase').mockReturnValue(db);
+  });
+
+  afterEach(() => {
+    db.close();
+    vi.restoreAllMocks();
+  });
+
+  it('should return the cached statement for repeated SQL', () => {
+    const prepareSpy = vi.spyOn(db, 'prepare');
+
+    const first = DatabaseManager.prepare('SELECT id FROM items WHERE id = ?');
+    const second = DatabaseManager.prepare('SELECT id FROM items WHERE id = ?');
+
+    expect(second).toBe(first);
+    expect(prepareSpy).toHaveBeenCalledTimes(1);
+  });
+
+  it('should keep statements usable across calls', () => {
+    DatabaseManager.prepare('INSERT INTO items (id) VALUES (?)').run('a');
+    DatabaseManager.prepare('INSERT INTO items (id) VALUES (?)').run('b');
+
+    const count = DatabaseManager.prepare('SELECT COUNT(*) as count FROM items').get() as { count: number };
+    expect(count.count).toBe(2);
+  });
+
+  it('should not share statements between connections', () => {
+    const first = DatabaseManager.prepare('SELECT id FROM items');
+
+    const other = new Database(':memory:');
+    other.exec('CREATE TABLE items (id TEXT PRIMARY KEY)');
+    vi.mocked(DatabaseManager.getDatabase).mockReturnValue(other);
+
+    try {
+      expect(DatabaseManager.prepare('SELECT id FROM items')).not.toBe(first);
+    } finally {
+      other.close();
+    }
+  });
+});
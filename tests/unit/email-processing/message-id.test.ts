@@ -0,0 +1,33 @@
+/**
+ * Unit tests for Message-ID normalization shared by all parsers
+ *
+ * @tests/unit/email-processing/message-id.test.ts
+ */
+
+import { describe, it, expect } from 'vitest';
+import { normalizeMessageId } from '@/email/parsers/messageId';
+
+describe('normalizeMessageId', () => {
+  it('should strip surrounding angle brackets', () => {
+    expect(normalizeMessageId('<abc@example.com>')).toBe('abc@example.com');
+  });
+
+  it('should return unbracketed IDs unchanged', () => {
+    expect(normalizeMessageId('abc@example.com')).toBe('abc@example.com');
+  });
+
+  it('should strip a lone leading or trailing bracket', () => {
+    expect(normalizeMessageId('<abc@example.com')).toBe('abc@example.com');
+    expect(normalizeMessageId('abc@example.com>')).toBe('abc@example.com');
+  });
+
+  it('should only strip brackets at the ends', () => {
+    expect(normalizeMessageId('<a<b>c>')).toBe('a<b>c');
+  });
+
+  it('should match the previous regex-based cleanup on edge cases', () => {
+    for (const raw of ['', '<', '>', '<>', '><', '<<x>>', ' <x> ']) {
+      expect(normalizeMessageId(raw)).toBe(raw.replace(/^<|>$/g, ''));
+    }
+  });
+});
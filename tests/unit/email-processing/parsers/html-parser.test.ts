@@ -46,11 +46,9 @@ vi.mock('@/config/logger', () => ({
 }));
 
 describe('HtmlParser', () => {
-  let parser: HtmlParser;
+  const parser = new HtmlParser();
 
   beforeEach(() => {
-    parser = new HtmlParser();
-
     // Set default mock behaviors: load() must return a callable $ (selector) => element
     mockRefs.readFile.mockResolvedValue('');
     const empty = { attr: () => undefined, text: () => '', first: () => ({ attr: () => undefined, text: () => '' }) };
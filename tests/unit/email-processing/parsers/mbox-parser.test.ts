@@ -18,6 +18,7 @@ import * as crypto from 'crypto';
 
 // Hoist mock refs so vi.mock factories see them (vitest hoists vi.mock before variable init)
 const mockReadFile = vi.hoisted(() => vi.fn());
+const mockStat = vi.hoisted(() => vi.fn());
 const mockLoggerDebug = vi.hoisted(() => vi.fn());
 const mockLoggerInfo = vi.hoisted(() => vi.fn());
 const mockLoggerWarn = vi.hoisted(() => vi.fn());
@@ -27,6 +28,7 @@ const mockLoggerError = vi.hoisted(() => vi.fn());
 vi.mock('fs', () => ({
   promises: {
     readFile: mockReadFile,
+    stat: mockStat,
   },
 }));
 
@@ -45,9 +47,11 @@ describe('MboxParser', () => {
 
   beforeEach(() => {
     parser = new MboxParser();
+    (MboxParser as unknown as { parsedCache: Map<string, unknown> }).parsedCache = new Map();
 
     // Reset all mocks
     mockReadFile.mockReset();
+    mockStat.mockReset();
     mockLoggerDebug.mockReset();
     mockLoggerInfo.mockReset();
     mockLoggerWarn.mockReset();
@@ -55,6 +59,7 @@ describe('MboxParser', () => {
 
     // Set default mock behavior
     mockReadFile.mockResolvedValue('');
+    mockStat.mockResolvedValue({ size: 1024, mtimeMs: 1706400000000 });
   });
 
   afterEach(() => {
@@ -668,4 +673,35 @@ ${bodyContent}`;
       expect(result.body).toContain(bodyContent);
     });
   });
+
+  describe('Parse Cache', () => {
+    const mboxContent = `From sender@example.com Mon Feb  5 10:00:00 2024
+Message-ID: <cached@example.com>
+From: sender@example.com
+Subject: Cached
+
+${'Body '.repeat(60)}`;
+
+    it('should not re-read an unchanged mbox file', async () => {
+      mockReadFile.mockResolvedValue(mboxContent);
+
+      const first = await parser.parse('/test/cached.mbox');
+      first.body = 'mutated by caller';
+      const second = await parser.parse('/test/cached.mbox');
+
+      expect(mockReadFile).toHaveBeenCalledTimes(1);
+      expect(second.message_id).toBe('cached@example.com');
+      expect(second.body).toContain('Body Body');
+    });
+
+    it('should re-read the file when its mtime changes', async () => {
+      mockReadFile.mockResolvedValue(mboxContent);
+
+      await parser.parse('/test/changed.mbox');
+      mockStat.mockResolvedValue({ size: 1024, mtimeMs: 1706400060000 });
+      await parser.parse('/test/changed.mbox');
+
+      expect(mockReadFile).toHaveBeenCalledTimes(2);
+    });
+  });
 });
@@ -35,10 +35,9 @@ vi.mock('@/config/logger', () => ({
 }));
 
 describe('MsgParser', () => {
-  let parser: MsgParser;
+  const parser = new MsgParser();
 
   beforeEach(() => {
-    parser = new MsgParser();
     vi.clearAllMocks();
   });
 
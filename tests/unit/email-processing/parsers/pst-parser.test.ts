@@ -15,10 +15,12 @@ import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { PstParser } from '@/email/parsers/PstParser';
 import { logger } from '@/config/logger';
 import * as crypto from 'crypto';
+import * as path from 'path';
 
 // Hoist mock refs so vi.mock factories see them (vitest hoists vi.mock before variable init)
 const mockExec = vi.hoisted(() => vi.fn());
 const mockMkdir = vi.hoisted(() => vi.fn());
+const mockAccess = vi.hoisted(() => vi.fn());
 const mockReadFile = vi.hoisted(() => vi.fn());
 const mockReaddir = vi.hoisted(() => vi.fn());
 const mockRm = vi.hoisted(() => vi.fn());
@@ -34,7 +36,9 @@ vi.mock('child_process', () => ({
 
 // Mock fs promises
 vi.mock('fs', () => ({
+  constants: { X_OK: 1 },
   promises: {
+    access: mockAccess,
     mkdir: mockMkdir,
     readFile: mockReadFile,
     readdir: mockReaddir,
@@ -58,9 +62,14 @@ describe('PstParser', () => {
   beforeEach(() => {
     parser = new PstParser();
 
+    // Reset the cached readpst probe so each test controls availability
+    (PstParser as unknown as { readpstProbe: Promise<string> | null }).readpstProbe = null;
+    (PstParser as unknown as { tempDirReady: Promise<void> | null }).tempDirReady = null;
+
     // Reset all mocks
     mockExec.mockReset();
     mockMkdir.mockReset();
+    mockAccess.mockReset();
     mockReadFile.mockReset();
     mockReaddir.mockReset();
     mockRm.mockReset();
@@ -69,12 +78,8 @@ describe('PstParser', () => {
     mockLoggerWarn.mockReset();
     mockLoggerError.mockReset();
 
-    // Default mock for which command (readpst available)
-    mockExec.mockImplementation((cmd: string, callback: any) => {
-      if (cmd.startsWith('which')) {
-        callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
-      }
-    });
+    // readpst executable found by the install probe by default
+    mockAccess.mockResolvedValue(undefined);
   });
 
   afterEach(() => {
@@ -86,7 +91,7 @@ describe('PstParser', () => {
       mockExec.mockImplementation((cmd: string, callback: any) => {
         if (cmd.startsWith('which readpst')) {
           callback(null, '/usr/bin/readpst', '');
-        } else if (cmd.startsWith('readpst')) {
+        } else if (cmd.includes('/readpst" ')) {
           callback(null, '', '');
         }
       });
@@ -101,21 +106,156 @@ describe('PstParser', () => {
     });
 
     it('should throw error when readpst not found', async () => {
-      mockExec.mockImplementation((cmd: string, callback: any) => {
-        if (cmd.startsWith('which readpst')) {
-          callback(new Error('command not found'), { stdout: '', stderr: '' });
-        }
-      });
+      mockAccess.mockRejectedValue(Object.assign(new Error('ENOENT'), { code: 'ENOENT' }));
 
       await expect(parser.parse('/test/archive.pst')).rejects.toThrow('readpst command not found');
     });
 
-    it('should provide installation instructions in error message', async () => {
+    it('should probe for readpst only once across parses', async () => {
       mockExec.mockImplementation((cmd: string, callback: any) => {
         if (cmd.startsWith('which readpst')) {
-          callback(new Error('not found'), { stdout: '', stderr: '' });
+          callback(null, '/usr/bin/readpst', '');
+        } else if (cmd.includes('/readpst" ')) {
+          callback(null, '', '');
         }
       });
+      mockMkdir.mockResolvedValue(undefined);
+      mockReaddir.mockResolvedValue(['one.eml']);
+      mockReadFile.mockResolvedValue(`Message-ID: <x@y>\nFrom: a@b\nSubject: S\nDate: Mon, 05 Feb 2024 10:00:00 +0000\n\n${'A'.repeat(300)}`);
+      mockRm.mockResolvedValue(undefined);
+
+      await parser.parse('/test/archive1.pst');
+      const probeCalls = mockAccess.mock.calls.length;
+      await new PstParser().parse('/test/archive2.pst');
+
+      expect(probeCalls).toBeGreaterThan(0);
+      expect(mockAccess.mock.calls.length).toBe(probeCalls);
+    });
+
+    it('should run readpst from the known location the probe found', async () => {
+      const originalPath = process.env.PATH;
+      process.env.PATH = '';
+      const knownPath = '/usr/local/bin/readpst';
+
+      mockAccess.mockImplementation((p: string) =>
+        p === knownPath ? Promise.resolve() : Promise.reject(Object.assign(new Error('ENOENT'), { code: 'ENOENT' }))
+      );
+      mockExec.mockImplementation((_cmd: string, callback: any) => {
+        callback(null, '', '');
+      });
+      mockMkdir.mockResolvedValue(undefined);
+      mockReaddir.mockResolvedValue(['one.eml']);
+      mockReadFile.mockResolvedValue(`Message-ID: <x@y>\nFrom: a@b\nSubject: S\nDate: Mon, 05 Feb 2024 10:00:00 +0000\n\n${'A'.repeat(300)}`);
+      mockRm.mockResolvedValue(undefined);
+
+      try {
+        await parser.parse('/test/archive.pst');
+      } finally {
+        process.env.PATH = originalPath;
+      }
+
+      expect(mockExec).toHaveBeenCalledTimes(1);
+      expect(mockExec.mock.calls[0][0]).toMatch(/^"\/usr\/local\/bin\/readpst" -r /);
+    });
+
+    it('should run the first executable install location in platform order', async () => {
+      const statics = PstParser as unknown as { READPST_KNOWN_PATHS: readonly string[] };
+      const originalKnownPaths = statics.READPST_KNOWN_PATHS;
+      const originalPath = process.env.PATH;
+      statics.READPST_KNOWN_PATHS = ['/first/bin/readpst', '/second/bin/readpst', '/third/bin/readpst'];
+      process.env.PATH = '';
+
+      mockAccess.mockImplementation((p: string) =>
+        p === '/first/bin/readpst'
+          ? Promise.reject(Object.assign(new Error('ENOENT'), { code: 'ENOENT' }))
+          : Promise.resolve()
+      );
+      mockExec.mockImplementation((_cmd: string, callback: any) => {
+        callback(null, '', '');
+      });
+      mockMkdir.mockResolvedValue(undefined);
+      mockReaddir.mockResolvedValue(['one.eml']);
+      mockReadFile.mockResolvedValue(`Message-ID: <x@y>\nFrom: a@b\nSubject: S\nDate: Mon, 05 Feb 2024 10:00:00 +0000\n\n${'A'.repeat(300)}`);
+      mockRm.mockResolvedValue(undefined);
+
+      try {
+        await parser.parse('/test/archive.pst');
+      } finally {
+        statics.READPST_KNOWN_PATHS = originalKnownPaths;
+        process.env.PATH = originalPath;
+      }
+
+      expect(mockAccess).not.toHaveBeenCalledWith('/third/bin/readpst', 1);
+      expect(mockExec.mock.calls[0][0]).toMatch(/^"\/second\/bin\/readpst" -r /);
+    });
+
+    it('should run MacPorts readpst when it is the only macOS install', async () => {
+      const statics = PstParser as unknown as {
+        READPST_KNOWN_PATHS: readonly string[];
+        READPST_KNOWN_PATHS_BY_PLATFORM: Record<string, readonly string[]>;
+      };
+      const originalKnownPaths = statics.READPST_KNOWN_PATHS;
+      const originalPath = process.env.PATH;
+      statics.READPST_KNOWN_PATHS = statics.READPST_KNOWN_PATHS_BY_PLATFORM.darwin;
+      process.env.PATH = '';
+
+      mockAccess.mockImplementation((p: string) =>
+        p === '/opt/local/bin/readpst'
+          ? Promise.resolve()
+          : Promise.reject(Object.assign(new Error('ENOENT'), { code: 'ENOENT' }))
+      );
+      mockExec.mockImplementation((_cmd: string, callback: any) => {
+        callback(null, '', '');
+      });
+      mockMkdir.mockResolvedValue(undefined);
+      mockReaddir.mockResolvedValue(['one.eml']);
+      mockReadFile.mockResolvedValue(`Message-ID: <x@y>\nFrom: a@b\nSubject: S\nDate: Mon, 05 Feb 2024 10:00:00 +0000\n\n${'A'.repeat(300)}`);
+      mockRm.mockResolvedValue(undefined);
+
+      try {
+        await parser.parse('/test/archive.pst');
+      } finally {
+        statics.READPST_KNOWN_PATHS = originalKnownPaths;
+        process.env.PATH = originalPath;
+      }
+
+      expect(mockExec.mock.calls[0][0]).toMatch(/^"\/opt\/local\/bin\/readpst" -r /);
+    });
+
+    it('should find readpst on PATH without spawning which', async () => {
+      const originalPath = process.env.PATH;
+      process.env.PATH = ['/custom/tools/bin', '/opt/pst/bin'].join(path.delimiter);
+      const onPath = path.join('/opt/pst/bin', 'readpst');
+
+      mockAccess.mockImplementation((p: string) =>
+        p === onPath ? Promise.resolve() : Promise.reject(Object.assign(new Error('ENOENT'), { code: 'ENOENT' }))
+      );
+      mockExec.mockImplementation((_cmd: string, callback: any) => {
+        callback(null, '', '');
+      });
+      mockMkdir.mockResolvedValue(undefined);
+      mockReaddir.mockResolvedValue(['one.eml']);
+      mockReadFile.mockResolvedValue(`Message-ID: <x@y>\nFrom: a@b\nSubject: S\nDate: Mon, 05 Feb 2024 10:00:00 +0000\n\n${'A'.repeat(300)}`);
+      mockRm.mockResolvedValue(undefined);
+
+      try {
+        await parser.parse('/test/archive.pst');
+      } finally {
+        process.env.PATH = originalPath;
+      }
+
+      expect(mockAccess).toHaveBeenCalledWith(onPath, 1);
+      const whichCalls = mockExec.mock.calls.filter(
+        (call: unknown[]) => typeof call[0] === 'string' && call[0].startsWith('which')
+      );
+      expect(whichCalls).toHaveLength(0);
+      // The PATH entry that passed the probe is the one extraction runs
+      expect(mockExec).toHaveBeenCalledTimes(1);
+      expect(mockExec.mock.calls[0][0]).toContain(`"${onPath}" -r `);
+    });
+
+    it('should provide installation instructions in error message', async () => {
+      mockAccess.mockRejectedValue(Object.assign(new Error('ENOENT'), { code: 'ENOENT' }));
 
       await expect(parser.parse('/test/archive.pst')).rejects.toThrow('sudo apt-get install');
     });
@@ -130,7 +270,7 @@ describe('PstParser', () => {
         if (typeof cb !== 'function') return;
         if (cmd.startsWith('which readpst')) {
           cb(null, '/usr/bin/readpst', '');
-        } else if (cmd.startsWith('readpst')) {
+        } else if (cmd.includes('/readpst" ')) {
           cb(null, '', '');
         }
       });
@@ -153,7 +293,7 @@ ${'A'.repeat(300)}`;
 
       const readpstCall = mockExec.mock.calls.find(
         (call: unknown[]): call is [string, ...unknown[]] =>
-          typeof call[0] === 'string' && call[0].startsWith('readpst')
+          typeof call[0] === 'string' && call[0].includes('/readpst" ')
       );
       expect(readpstCall).toBeDefined();
       expect(readpstCall![0]).toContain('-r');
@@ -183,6 +323,22 @@ ${'A'.repeat(300)}`;
         { recursive: true }
       );
     });
+
+    it('should create temp directory only once across parses', async () => {
+      await parser.parse('/test/archive1.pst');
+      await new PstParser().parse('/test/archive2.pst');
+
+      expect(mockMkdir).toHaveBeenCalledTimes(1);
+    });
+
+    it('should recreate temp directory after a failed parse', async () => {
+      mockReaddir.mockResolvedValueOnce([]);
+      await expect(parser.parse('/test/empty.pst')).rejects.toThrow('No emails found');
+
+      await parser.parse('/test/archive.pst');
+
+      expect(mockMkdir).toHaveBeenCalledTimes(2);
+    });
   });
 
   describe('.eml Content Parsing', () => {
@@ -192,7 +348,7 @@ ${'A'.repeat(300)}`;
         const cb = args[args.length - 1];
         if (typeof cb !== 'function') return;
         if (cmd.startsWith('which readpst')) cb(null, '/usr/bin/readpst', '');
-        else if (cmd.startsWith('readpst')) cb(null, '', '');
+        else if (cmd.includes('/readpst" ')) cb(null, '', '');
       });
       mockMkdir.mockResolvedValue(undefined);
       mockReaddir.mockResolvedValue(['test.eml']);
@@ -313,7 +469,7 @@ ${bodyText}`;
         if (cmd.startsWith('which readpst')) {
           callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
         }
-        if (cmd.startsWith('readpst')) {
+        if (cmd.includes('/readpst" ')) {
           callback(null, { stdout: '', stderr: '' });
         }
       });
@@ -369,7 +525,7 @@ ${'I'.repeat(300)}`;
         if (cmd.startsWith('which readpst')) {
           callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
         }
-        if (cmd.startsWith('readpst')) {
+        if (cmd.includes('/readpst" ')) {
           callback(null, { stdout: '', stderr: '' });
         }
       });
@@ -462,7 +618,7 @@ ${bodyContent}`;
         if (cmd.startsWith('which readpst')) {
           callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
         }
-        if (cmd.startsWith('readpst')) {
+        if (cmd.includes('/readpst" ')) {
           callback(null, { stdout: '', stderr: '' });
         }
       });
@@ -504,7 +660,7 @@ ${'L'.repeat(300)}`;
         if (cmd.startsWith('which readpst')) {
           callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
         }
-        if (cmd.startsWith('readpst')) {
+        if (cmd.includes('/readpst" ')) {
           callback(new Error('Extraction failed'), { stdout: '', stderr: 'Error' });
         }
       });
@@ -545,7 +701,7 @@ ${'L'.repeat(300)}`;
         if (cmd.startsWith('which readpst')) {
           callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
         }
-        if (cmd.startsWith('readpst')) {
+        if (cmd.includes('/readpst" ')) {
           callback(null, { stdout: '', stderr: '' });
         }
       });
@@ -587,7 +743,7 @@ ${'M'.repeat(300)}`;
         if (cmd.startsWith('which readpst')) {
           callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
         }
-        if (cmd.startsWith('readpst')) {
+        if (cmd.includes('/readpst" ')) {
           callback(null, { stdout: '', stderr: '' });
         }
       });
@@ -639,7 +795,7 @@ ${'M'.repeat(300)}`;
         if (cmd.startsWith('which readpst')) {
           callback(null, { stdout: '/usr/bin/readpst', stderr: '' });
         }
-        if (cmd.startsWith('readpst')) {
+        if (cmd.includes('/readpst" ')) {
           callback(null, { stdout: '', stderr: '' });
         }
       });
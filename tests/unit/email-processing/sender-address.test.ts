@@ -0,0 +1,37 @@
+/**
+ * Unit tests for From header address extraction shared by parsers
+ *
+ * @tests/unit/email-processing/sender-address.test.ts
+ */
+
+import { describe, it, expect } from 'vitest';
+import { parseSenderAddress } from '@/email/parsers/address';
+
+describe('parseSenderAddress', () => {
+  it('should extract the address inside angle brackets', () => {
+    expect(parseSenderAddress('"Alice" <alice@example.com>')).toBe('alice@example.com');
+  });
+
+  it('should return a plain address unchanged', () => {
+    expect(parseSenderAddress('alice@example.com')).toBe('alice@example.com');
+  });
+
+  it('should return undefined when no address is present', () => {
+    expect(parseSenderAddress('Alice')).toBeUndefined();
+    expect(parseSenderAddress('')).toBeUndefined();
+  });
+
+  it('should match the previous regex-based extraction on edge cases', () => {
+    const previous = (value: string): string | undefined => {
+      const match = value.match(/<([^>]+)>/);
+      if (match) {
+        return match[1];
+      }
+      return value.includes('@') ? value : undefined;
+    };
+
+    for (const raw of ['<>', '<> <a@b>', '<a<b>', 'a@b <', 'x> <y', '<>@', '<<a>>']) {
+      expect(parseSenderAddress(raw)).toBe(previous(raw));
+    }
+  });
+});
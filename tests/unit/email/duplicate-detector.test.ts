@@ -194,7 +194,7 @@ describe('DuplicateDetector', () => {
       });
 
       // Verify updateLastSeen was called
-      expect(mockUpdateLastSeen).toHaveBeenCalledWith(sampleEmail1.email_hash);
+      expect(mockUpdateLastSeen).toHaveBeenCalledWith(sampleEmail1.email_hash, stats.seen_at);
 
       // Verify stats tracking
       expect(stats.cross_batch_count).toBe(1);
@@ -409,6 +409,27 @@ describe('DuplicateDetector', () => {
       expect(result.stats.cross_batch_count).toBe(1);
     });
 
+    it('should stamp every cross-batch duplicate with the shared batch timestamp', async () => {
+      const existingRecord = {
+        email_hash: sampleEmail1.email_hash,
+        processed_at: 1706342400,
+        last_seen_at: 1706342400,
+        report_date: '2026-01-27',
+        attachments_meta: '[]',
+        extract_status: ExtractStatus.SUCCESS,
+      };
+
+      mockFindByHash.mockReturnValue(existingRecord);
+      mockUpdateLastSeen.mockReturnValue(existingRecord);
+
+      const result = await detector.batchCheckDuplicates([sampleEmail1, sampleEmail2], 1706400000);
+
+      expect(result.stats.seen_at).toBe(1706400000);
+      expect(mockUpdateLastSeen).toHaveBeenCalledTimes(2);
+      expect(mockUpdateLastSeen).toHaveBeenNthCalledWith(1, sampleEmail1.email_hash, 1706400000);
+      expect(mockUpdateLastSeen).toHaveBeenNthCalledWith(2, sampleEmail2.email_hash, 1706400000);
+    });
+
     it('should log summary after batch processing', async () => {
       const emails: ParsedEmail[] = [sampleEmail1, duplicateEmail1];
 
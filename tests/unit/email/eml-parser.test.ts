@@ -14,11 +14,10 @@ import * as os from 'os';
 import { EmlParser } from '@/email/parsers/EmlParser';
 
 describe('EmlParser', () => {
-  let parser: EmlParser;
+  const parser = new EmlParser();
   let tempDir: string;
 
   beforeEach(async () => {
-    parser = new EmlParser();
     tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'eml-test-'));
   });
 
@@ -290,6 +290,95 @@ describe('EmailProcessor', () => {
       expect(result.items.length).toBe(0);
     });
 
+    it('should collect parse errors from every file when parsing concurrently', async () => {
+      // Arrange
+      const concurrentProcessor = new EmailProcessor(mockLLM, { parseConcurrency: 2 });
+      const emailFiles = [
+        path.join(tempDir, 'missing1.eml'),
+        path.join(tempDir, 'unsupported.txt'),
+        path.join(tempDir, 'missing2.eml'),
+        path.join(tempDir, 'missing3.eml'),
+        path.join(tempDir, 'missing4.eml'),
+      ];
+
+      // Act
+      const result = await concurrentProcessor.processBatch(emailFiles, '2026-01-31', 'remote');
+
+      // Assert
+      expect(result.batch_info.total_emails).toBe(5);
+      expect(result.batch_info.processed_emails).toBe(0);
+      expect(result.batch_info.skipped_emails).toBe(5);
+    });
+
+    it('should keep submission order and store each parsed email once when parsing concurrently', async () => {
+      // Arrange
+      const concurrentProcessor = new EmailProcessor(mockLLM, { parseConcurrency: 2 });
+      const validFiles = [
+        await createTestEmailFile(tempDir, 'first.eml'),
+        await createTestEmailFile(tempDir, 'second.eml'),
+        await createTestEmailFile(tempDir, 'third.eml'),
+      ];
+      const emailFiles = [
+        validFiles[0],
+        path.join(tempDir, 'missing.eml'),
+        validFiles[1],
+        path.join(tempDir, 'unsupported.txt'),
+        validFiles[2],
+      ];
+
+      // One item per email, each referencing only its own email
+      const generateSpy = vi.spyOn(mockLLM, 'generate').mockImplementation(async (batch) => ({
+        items: batch.emails.map((email, index) => ({
+          content: `Follow up on ${email.subject}`,
+          type: 'pending' as const,
+          source_email_indices: [index],
+          evidence: 'Follow-up requested',
+          confidence: 80,
+          source_status: 'verified' as const,
+        })),
+        batch_info: {
+          total_emails: batch.emails.length,
+          processed_emails: batch.emails.length,
+          skipped_emails: 0,
+        },
+      }));
+
+      // Act
+      const result = await concurrentProcessor.processBatch(emailFiles, '2026-01-31', 'remote');
+
+      // Assert
+      expect(result.success).toBe(true);
+      expect(result.batch_info.processed_emails).toBe(3);
+      expect(result.batch_info.skipped_emails).toBe(2);
+
+      const sentEmails = generateSpy.mock.calls[0][0].emails;
+      expect(sentEmails.map((email) => email.file_path)).toEqual(validFiles);
+
+      const db = DatabaseManager.getDatabase();
+      const itemIds = result.items.map((item) => item.item_id);
+      expect(itemIds).toHaveLength(3);
+
+      const refs = db
+        .prepare(
+          `SELECT email_hash, COUNT(*) AS count FROM item_email_refs
+           WHERE item_id IN (${itemIds.map(() => '?').join(', ')})
+           GROUP BY email_hash`
+        )
+        .all(...itemIds) as Array<{ email_hash: string; count: number }>;
+      expect(refs).toHaveLength(3);
+      expect(refs.every((ref) => ref.count === 1)).toBe(true);
+      expect(refs.map((ref) => ref.email_hash).sort()).toEqual(
+        sentEmails.map((email) => email.email_hash).sort()
+      );
+
+      for (const email of sentEmails) {
+        const stored = db
+          .prepare('SELECT COUNT(*) AS count FROM processed_emails WHERE email_hash = ?')
+          .get(email.email_hash) as { count: number };
+        expect(stored.count).toBe(1);
+      }
+    });
+
     it('should skip duplicate emails in same batch', async () => {
       // Arrange
       createMockParsedEmail({
@@ -7,16 +7,12 @@
  * @module tests/unit/email/traceability-generator.test
  */
 
-import { describe, it, expect, beforeEach } from 'vitest';
+import { describe, it, expect } from 'vitest';
 import { TraceabilityGenerator } from '@/email/TraceabilityGenerator';
 import type { ParsedEmail } from '@/email/parsers/EmailParser';
 
 describe('TraceabilityGenerator', () => {
-  let generator: TraceabilityGenerator;
-
-  beforeEach(() => {
-    generator = new TraceabilityGenerator();
-  });
+  const generator = new TraceabilityGenerator();
 
   describe('generateTraceability', () => {
     it('should generate complete traceability info', () => {
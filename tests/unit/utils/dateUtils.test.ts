@@ -19,6 +19,9 @@ import {
   getAgeInDays,
 } from '@shared/utils/dateUtils';
 
+/** Fixed reference time so age calculations do not depend on the wall clock. */
+const FIXED_NOW = new Date('2026-01-27T10:30:00Z');
+
 describe('formatYYYYMMDD', () => {
   it('should format ISO date string to YYYY-MM-DD', () => {
     const result = formatYYYYMMDD('2026-01-27T10:30:00Z');
@@ -42,6 +45,10 @@ describe('formatYYYYMMDD', () => {
     expect(result).toBe('2024-02-29');
   });
 
+  it('should zero-pad short years, months and days', () => {
+    expect(formatYYYYMMDD(new Date(999, 2, 5))).toBe('0999-03-05');
+  });
+
   it('should return current date for invalid date string', () => {
     const result = formatYYYYMMDD('invalid-date');
     // Should return today's date in YYYY-MM-DD format
@@ -110,6 +117,11 @@ describe('parseEmailDate', () => {
     expect(result).toMatch(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?(Z|[+-]\d{2}:\d{2})$/);
   });
 
+  it('should parse RFC 5322 dates to the same instant as the native parser', () => {
+    const rfcDate = 'Wed, 21 Feb 2024 14:22:03 +0000';
+    expect(new Date(parseEmailDate(rfcDate)).getTime()).toBe(new Date(rfcDate).getTime());
+  });
+
   it('should handle invalid date headers gracefully', () => {
     const result = parseEmailDate('invalid-date-header');
     expect(result).toMatch(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?(Z|[+-]\d{2}:\d{2})$/);
@@ -235,22 +247,31 @@ describe('formatDateForDisplay', () => {
     expect(formatDateForDisplay('invalid-date')).toBe('');
     expect(formatDateForDisplay(undefined as any)).toBe('');
   });
+
+  it('should format consistently when switching between locales', () => {
+    const zh = formatDateForDisplay('2026-01-27T10:30:00Z', 'zh-CN');
+    const en = formatDateForDisplay('2026-01-27T10:30:00Z', 'en-US');
+
+    expect(formatDateForDisplay('2026-01-27T10:30:00Z', 'zh-CN')).toBe(zh);
+    expect(formatDateForDisplay('2026-01-27T10:30:00Z', 'en-US')).toBe(en);
+    expect(en).not.toBe(zh);
+  });
+
+  it('should return empty string for an invalid locale', () => {
+    expect(formatDateForDisplay('2026-01-27T10:30:00Z', 'not a locale!')).toBe('');
+  });
 });
 
 describe('getAgeInDays', () => {
   it('should calculate age in days correctly', () => {
-    const pastDate = new Date();
-    pastDate.setDate(pastDate.getDate() - 7); // 7 days ago
+    const pastDate = new Date('2026-01-20T10:30:00Z'); // 7 days before FIXED_NOW
 
-    const result = getAgeInDays(pastDate);
+    const result = getAgeInDays(pastDate, FIXED_NOW);
     expect(result).toBe(7);
   });
 
   it('should handle date string input', () => {
-    const pastDate = new Date();
-    pastDate.setDate(pastDate.getDate() - 30);
-
-    const result = getAgeInDays(pastDate.toISOString());
+    const result = getAgeInDays('2025-12-28T10:30:00Z', FIXED_NOW);
     expect(result).toBe(30);
   });
 
@@ -260,11 +281,10 @@ describe('getAgeInDays', () => {
   });
 
   it('should calculate age for future dates correctly (negative result)', () => {
-    const futureDate = new Date();
-    futureDate.setDate(futureDate.getDate() + 10);
+    const futureDate = new Date('2026-02-06T10:30:00Z'); // 10 days after FIXED_NOW
 
-    const result = getAgeInDays(futureDate);
-    expect(result).toBeLessThan(0);
+    const result = getAgeInDays(futureDate, FIXED_NOW);
+    expect(result).toBe(-10);
   });
 
   it('should handle leap years correctly', () => {